@@ -40,14 +40,14 @@ async def analyze_document(
         if file.size and file.size > settings.MAX_FILE_SIZE:
             raise HTTPException(status_code=400, detail="File too large")
         
-        # Upload file to storage
+        # Upload file to storage; the hash is computed during the upload
         file_storage = FileStorageService()
-        file_url = await file_storage.upload_file(file)
+        file_url, file_hash = await file_storage.upload_file_with_hash(file)
         
         # Create document record
         document = Document(
             title=file.filename,
-            file_hash=file_storage.calculate_hash(file),
+            file_hash=file_hash,
             file_size=file.size or 0,
             file_type=file.content_type or "application/octet-stream",
             file_url=file_url,
@@ -64,7 +64,7 @@ async def analyze_document(
             perform_ai_analysis,
             document.id,
             file_url,
-            file_storage.calculate_hash(file),
+            file_hash,
             db
         )
         
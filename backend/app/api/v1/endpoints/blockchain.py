@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Path
 from sqlalchemy.orm import Session
 from typing import List, Optional
 import logging
@@ -97,7 +97,7 @@ async def get_blockchain_transaction(
 
 @router.get("/verify/{document_hash}")
 async def verify_document_on_blockchain(
-    document_hash: str,
+    document_hash: str = Path(..., pattern=r"^[0-9a-fA-F]{64}$"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
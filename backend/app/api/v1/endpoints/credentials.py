@@ -3,7 +3,6 @@ from sqlalchemy.orm import Session
 from typing import List, Optional
 import logging
 from datetime import datetime, timedelta
-import qrcode
 import json
 import base64
 from io import BytesIO
@@ -280,7 +279,7 @@ async def get_credential_qr(
     }
     
     qr_service = QRCodeService()
-    qr_code_base64 = qr_service.generate_qr_code(json.dumps(qr_data))
+    qr_code_base64 = qr_service.generate_data_qr(qr_data)
     
     return {
         "credential_id": credential.id,
@@ -305,7 +304,7 @@ async def generate_credential_qr(credential_id: int, db: Session):
         }
         
         qr_service = QRCodeService()
-        qr_code_base64 = qr_service.generate_qr_code(json.dumps(qr_data))
+        qr_code_base64 = qr_service.generate_data_qr(qr_data)
         
         # Store QR code in credential metadata
         if not credential.metadata:
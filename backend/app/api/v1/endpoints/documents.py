@@ -1,8 +1,10 @@
 from typing import Any, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
 from sqlalchemy.orm import Session
+import asyncio
 import hashlib
 import os
+import re
 from datetime import datetime
 
 from app.core.database import get_db
@@ -13,11 +15,17 @@ from app.schemas.document import (
     DocumentCreate,
     DocumentResponse,
     DocumentUpdate,
-    DocumentList
+    DocumentList,
+    DocumentUploadUrlRequest,
+    DocumentUploadUrlResponse,
+    DocumentUploadComplete
 )
+from app.services.file_storage import FileStorageService
 
 router = APIRouter()
 
+ALLOWED_UPLOAD_TYPES = ["pdf", "jpg", "jpeg", "png", "tiff"]
+
 @router.post("/upload", response_model=DocumentResponse)
 async def upload_document(
     file: UploadFile = File(...),
@@ -31,12 +39,11 @@ async def upload_document(
     Upload a new document.
     """
     # Validate file type
-    allowed_types = ["pdf", "jpg", "jpeg", "png", "tiff"]
     file_extension = file.filename.split(".")[-1].lower()
-    if file_extension not in allowed_types:
+    if file_extension not in ALLOWED_UPLOAD_TYPES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"File type {file_extension} not allowed. Allowed types: {allowed_types}"
+            detail=f"File type {file_extension} not allowed. Allowed types: {ALLOWED_UPLOAD_TYPES}"
         )
     
     # Read file content and calculate hash
@@ -97,6 +104,124 @@ async def upload_document(
         expires_at=db_document.expires_at
     )
 
+@router.post("/upload-url", response_model=DocumentUploadUrlResponse)
+def create_upload_url(
+    upload_request: DocumentUploadUrlRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+) -> Any:
+    """
+    Get a presigned URL for uploading a document directly to storage.
+    """
+    file_extension = upload_request.filename.split(".")[-1].lower()
+    if file_extension not in ALLOWED_UPLOAD_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"File type {file_extension} not allowed. Allowed types: {ALLOWED_UPLOAD_TYPES}"
+        )
+    
+    if not re.fullmatch(r"[0-9a-fA-F]{64}", upload_request.file_hash):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="file_hash must be the hex SHA-256 of the file"
+        )
+    file_hash = upload_request.file_hash.lower()
+    
+    # Check if document already exists
+    existing_doc = db.query(Document).filter(Document.file_hash == file_hash).first()
+    if existing_doc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Document with this content already exists"
+        )
+    
+    file_storage = FileStorageService()
+    return file_storage.generate_upload_url(
+        f"{file_hash}.{file_extension}",
+        upload_request.content_type,
+        file_hash
+    )
+
+@router.post("/upload-complete", response_model=DocumentResponse)
+async def complete_upload(
+    upload: DocumentUploadComplete,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+) -> Any:
+    """
+    Register a document uploaded through a presigned URL.
+    """
+    file_hash, _, file_extension = upload.key.partition(".")
+    if not re.fullmatch(r"[0-9a-f]{64}", file_hash) or file_extension not in ALLOWED_UPLOAD_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid upload key"
+        )
+    
+    file_storage = FileStorageService()
+    uploaded = await asyncio.to_thread(file_storage.get_uploaded_file, upload.key)
+    if not uploaded:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Uploaded file not found"
+        )
+    
+    # The presigned PUT was signed with this checksum, so storage has usually
+    # verified it already; otherwise the hash was computed from the stored bytes
+    if uploaded["file_hash"] != file_hash:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Uploaded content does not match its hash"
+        )
+    
+    # Check if document already exists
+    existing_doc = db.query(Document).filter(Document.file_hash == file_hash).first()
+    if existing_doc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Document with this content already exists"
+        )
+    
+    # Create document record
+    db_document = Document(
+        title=upload.title,
+        description=upload.description,
+        document_type=upload.document_type.value if hasattr(upload.document_type, 'value') else upload.document_type,
+        file_hash=file_hash,
+        file_size=uploaded["file_size"],
+        file_type=file_extension,
+        file_url=uploaded["file_url"],
+        owner_id=current_user.id,
+        status=DocumentStatus.DRAFT
+    )
+    
+    db.add(db_document)
+    db.commit()
+    db.refresh(db_document)
+    
+    return DocumentResponse(
+        id=db_document.id,
+        title=db_document.title,
+        description=db_document.description,
+        document_type=db_document.document_type.value if hasattr(db_document.document_type, 'value') else db_document.document_type,
+        status=db_document.status,
+        file_hash=db_document.file_hash,
+        file_size=db_document.file_size,
+        file_type=db_document.file_type,
+        file_url=db_document.file_url,
+        owner_id=db_document.owner_id,
+        issuer_id=db_document.issuer_id,
+        organization_id=db_document.organization_id,
+        blockchain_hash=db_document.blockchain_hash,
+        blockchain_tx_id=db_document.blockchain_tx_id,
+        ai_verified=db_document.ai_verified,
+        ai_confidence_score=db_document.ai_confidence_score,
+        created_at=db_document.created_at,
+        updated_at=db_document.updated_at,
+        verified_at=db_document.verified_at,
+        expires_at=db_document.expires_at
+    )
+
 @router.get("/", response_model=DocumentList)
 def get_documents(
     skip: int = 0,
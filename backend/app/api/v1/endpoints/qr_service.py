@@ -1,7 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from typing import Dict, Any, Optional
-import qrcode
 import json
 import base64
 from io import BytesIO
@@ -21,6 +20,7 @@ logger = logging.getLogger(__name__)
 @router.post("/generate/document/{document_id}")
 async def generate_document_qr(
     document_id: int,
+    image_format: str = Query("png", pattern="^(png|svg)$", description="png (base64) or svg"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ) -> Dict[str, Any]:
@@ -55,11 +55,12 @@ async def generate_document_qr(
         
         # Generate QR code
         qr_service = QRService()
-        qr_code = qr_service.generate_qr_code(json.dumps(qr_data))
+        qr_code = qr_service.generate_data_qr(qr_data, image_format)
         
         return {
             "document_id": document_id,
             "qr_code": qr_code,
+            "format": image_format,
             "qr_data": qr_data,
             "generated_at": datetime.utcnow().isoformat()
         }
@@ -71,6 +72,7 @@ async def generate_document_qr(
 @router.post("/generate/credential/{credential_id}")
 async def generate_credential_qr(
     credential_id: int,
+    image_format: str = Query("png", pattern="^(png|svg)$", description="png (base64) or svg"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ) -> Dict[str, Any]:
@@ -103,11 +105,12 @@ async def generate_credential_qr(
         
         # Generate QR code
         qr_service = QRService()
-        qr_code = qr_service.generate_qr_code(json.dumps(qr_data))
+        qr_code = qr_service.generate_data_qr(qr_data, image_format)
         
         return {
             "credential_id": credential_id,
             "qr_code": qr_code,
+            "format": image_format,
             "qr_data": qr_data,
             "generated_at": datetime.utcnow().isoformat()
         }
@@ -51,6 +51,15 @@ class Settings(BaseSettings):
     FABRIC_CHANNEL_NAME: str = "intellitrust-channel"
     FABRIC_CHAINCODE_NAME: str = "document-chaincode"
     
+    # Blockchain (Ethereum/Polygon)
+    ETHEREUM_RPC_FALLBACK_URLS: Optional[str] = None  # Comma-separated extra endpoints for read-only calls
+    POLYGON_RPC_FALLBACK_URLS: Optional[str] = None
+    ETHEREUM_WS_URL: Optional[str] = None  # Enables newHeads-driven receipt waiting
+    POLYGON_WS_URL: Optional[str] = None
+    ETHEREUM_RPC_SYNC_SEND: bool = False  # Primary endpoint implements eth_sendRawTransactionSync
+    POLYGON_RPC_SYNC_SEND: bool = False
+    MOCK_CHAIN_LOG_PATH: Optional[str] = None  # Append-only log that persists the mock chain
+    
     # Email Configuration
     SMTP_HOST: Optional[str] = None
     SMTP_PORT: int = 587
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional, List
+from typing import Dict, Optional, List
 from pydantic import BaseModel
 from app.models.document import DocumentType, DocumentStatus
 
@@ -44,6 +44,20 @@ class DocumentList(BaseModel):
     skip: int
     limit: int
 
+class DocumentUploadUrlRequest(BaseModel):
+    filename: str
+    content_type: str
+    file_hash: str
+
+class DocumentUploadUrlResponse(BaseModel):
+    upload_url: str
+    key: str
+    headers: Dict[str, str]
+    expires_in: int
+
+class DocumentUploadComplete(DocumentBase):
+    key: str
+
 class DocumentMetadata(BaseModel):
     key: str
     value: str
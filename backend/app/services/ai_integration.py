@@ -1,11 +1,17 @@
 import httpx
 import logging
 import json
-from typing import Dict, Any, Optional
+import posixpath
+import secrets
+from urllib.parse import unquote, urlsplit
+from typing import Dict, Any, Optional, AsyncIterator
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Read size for streamed downloads forwarded to the AI engine
+STREAM_CHUNK_SIZE = 256 * 1024
+
 class AIIntegrationService:
     def __init__(self):
         self.ai_engine_url = settings.AI_ENGINE_URL
@@ -73,17 +79,13 @@ class AIIntegrationService:
         """
         try:
             async with httpx.AsyncClient(timeout=self.timeout * 2) as client:
-                # Download all files
-                files = []
-                for url in file_urls:
-                    file_response = await client.get(url)
-                    file_response.raise_for_status()
-                    files.append(('files', file_response.content))
-                
-                # Send batch request to AI engine
+                # Stream each download straight into the request body so only
+                # one chunk per file is held in memory at a time
+                boundary = secrets.token_hex(16)
                 response = await client.post(
                     f"{self.ai_engine_url}/batch-analyze",
-                    files=files
+                    content=self._stream_multipart(client, file_urls, boundary),
+                    headers={"Content-Type": f"multipart/form-data; boundary={boundary}"}
                 )
                 response.raise_for_status()
                 
@@ -96,6 +98,40 @@ class AIIntegrationService:
             logger.error(f"Error in batch analysis: {str(e)}")
             raise Exception(f"Batch analysis failed: {str(e)}")
 
+    async def _stream_multipart(
+        self, client: httpx.AsyncClient, file_urls: list[str], boundary: str
+    ) -> AsyncIterator[bytes]:
+        """
+        Yield a multipart/form-data body built from streamed file downloads
+        """
+        for index, url in enumerate(file_urls):
+            async with client.stream("GET", url) as file_response:
+                file_response.raise_for_status()
+                
+                # Keep the source file name and type; the AI engine picks its
+                # analyzer from the file extension
+                filename = self._part_filename(url, index)
+                content_type = file_response.headers.get("content-type", "application/octet-stream")
+                yield (
+                    f"--{boundary}\r\n"
+                    f'Content-Disposition: form-data; name="files"; filename="{filename}"\r\n'
+                    f"Content-Type: {content_type}\r\n\r\n"
+                ).encode()
+                async for chunk in file_response.aiter_bytes(STREAM_CHUNK_SIZE):
+                    yield chunk
+                yield b"\r\n"
+        yield f"--{boundary}--\r\n".encode()
+
+    @staticmethod
+    def _part_filename(url: str, index: int) -> str:
+        """
+        File name for a multipart part, taken from the last segment of the URL path
+        """
+        name = posixpath.basename(unquote(urlsplit(url).path))
+        # Drop characters that would break out of the quoted header value
+        name = "".join(c for c in name if c not in '"\\\r\n')
+        return name or f"document_{index}"
+
     async def health_check(self) -> bool:
         """
         Check if AI engine is healthy
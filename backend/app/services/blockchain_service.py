@@ -2,20 +2,33 @@ import asyncio
 import logging
 import json
 import hashlib
+import itertools
 import uuid
 from typing import Dict, Any, Optional, List, Union
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from types import MappingProxyType
 import aiohttp
 import base64
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.asymmetric import rsa, padding
-from web3 import Web3
+from web3 import Web3, AsyncWeb3, AsyncHTTPProvider, WebsocketProviderV2
+from web3.contract import AsyncContract
+from web3.datastructures import AttributeDict
+from web3.exceptions import TransactionNotFound
+from eth_abi import decode, encode
 from eth_account import Account
+from eth_account.signers.local import LocalAccount
 from eth_account.messages import encode_defunct
 import os
+import random
+import re
 import time
+import weakref
 from functools import wraps
+from cachetools import LRUCache, TTLCache
+import orjson
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -37,27 +50,463 @@ class TransactionError(BlockchainError):
     """Exception for transaction failures"""
     pass
 
+class ValidationError(BlockchainError):
+    """Exception for invalid input; retrying cannot succeed"""
+    pass
+
 def retry_on_failure(max_retries: int = 3, delay: float = 1.0):
     """Decorator to retry blockchain operations on failure"""
+    # Exponential backoff table; no delay follows the final attempt
+    delays = tuple(delay * (2 ** attempt) for attempt in range(max_retries - 1))
+    
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            last_exception = None
             for attempt in range(max_retries):
                 try:
                     return await func(*args, **kwargs)
+                except ValidationError:
+                    raise
                 except Exception as e:
-                    last_exception = e
-                    if attempt < max_retries - 1:
-                        logger.warning(f"Attempt {attempt + 1} failed: {str(e)}. Retrying in {delay} seconds...")
-                        await asyncio.sleep(delay * (2 ** attempt))  # Exponential backoff
-                    else:
+                    if attempt >= len(delays):
                         logger.error(f"All {max_retries} attempts failed. Last error: {str(e)}")
-                        raise last_exception
+                        raise
+                    # Up to 10% jitter so concurrent callers don't retry in lockstep
+                    retry_delay = delays[attempt] * (1 + 0.1 * random.random())
+                    logger.warning(f"Attempt {attempt + 1} failed: {str(e)}. Retrying in {retry_delay:.2f} seconds...")
+                    await asyncio.sleep(retry_delay)
             return None
         return wrapper
     return decorator
 
+# Anchoring rate limit: bucket size, refilled evenly over each minute
+RATE_LIMIT_BURST = 10
+
+# Multicall3 is deployed at the same address on Ethereum, Polygon and most EVM chains
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL_BATCH_SIZE = 200
+
+_MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"}
+                ],
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]"
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"}
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]"
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function"
+    }
+]
+
+# DocumentVerification contract ABI, shared by every service instance
+_CONTRACT_ABI = [
+    {
+        "inputs": [
+            {"internalType": "string", "name": "documentHash", "type": "string"},
+            {"internalType": "string", "name": "userDid", "type": "string"},
+            {"internalType": "string", "name": "metadata", "type": "string"}
+        ],
+        "name": "anchorDocument",
+        "outputs": [{"internalType": "bool", "name": "", "type": "bool"}],
+        "stateMutability": "nonpayable",
+        "type": "function"
+    },
+    {
+        "inputs": [{"internalType": "string", "name": "documentHash", "type": "string"}],
+        "name": "verifyDocument",
+        "outputs": [
+            {"internalType": "bool", "name": "exists", "type": "bool"},
+            {"internalType": "string", "name": "userDid", "type": "string"},
+            {"internalType": "uint256", "name": "timestamp", "type": "uint256"},
+            {"internalType": "string", "name": "metadata", "type": "string"},
+            {"internalType": "bool", "name": "revoked", "type": "bool"}
+        ],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "inputs": [
+            {"internalType": "string", "name": "documentHash", "type": "string"},
+            {"internalType": "string", "name": "reason", "type": "string"}
+        ],
+        "name": "revokeDocument",
+        "outputs": [{"internalType": "bool", "name": "", "type": "bool"}],
+        "stateMutability": "nonpayable",
+        "type": "function"
+    },
+    {
+        "inputs": [{"internalType": "string", "name": "documentHash", "type": "string"}],
+        "name": "getDocumentHistory",
+        "outputs": [
+            {"internalType": "uint256[]", "name": "timestamps", "type": "uint256[]"},
+            {"internalType": "string[]", "name": "actions", "type": "string[]"}
+        ],
+        "stateMutability": "view",
+        "type": "function"
+    }
+]
+
+# 4-byte selectors for the hot-path contract functions
+_ANCHOR_SELECTOR = Web3.keccak(text="anchorDocument(string,string,string)")[:4]
+_VERIFY_SELECTOR = Web3.keccak(text="verifyDocument(string)")[:4]
+
+# Contracts already checked for the required functions, keyed by
+# (chain_id, address, ABI digest) so re-initialization skips the ABI walk
+_CONTRACT_ABI_DIGEST = hashlib.blake2b(repr(_CONTRACT_ABI).encode(), digest_size=8).hexdigest()
+_VERIFIED_CONTRACTS: set = set()
+
+# File hashes are hex-encoded SHA-256 digests
+_HASH_RE = re.compile(r"[0-9a-fA-F]{64}")
+
+# Verification miss response; copied per call because callers persist results
+# (e.g. into JSON columns), which a read-only mapping cannot be serialized into
+_NOT_FOUND = MappingProxyType({
+    "verified": False,
+    "error": "Document not found on blockchain"
+})
+
+# Output types of DocumentVerification.verifyDocument
+_VERIFY_OUTPUT_TYPES = ['bool', 'string', 'uint256', 'string', 'bool']
+
+def _anchor_calldata(file_hash: str, user_did: str, metadata: Optional[Dict]) -> bytes:
+    """Encode an anchorDocument(file_hash, user_did, metadata JSON) call"""
+    metadata_str = orjson.dumps(metadata or {}).decode()
+    return _ANCHOR_SELECTOR + encode(['string', 'string', 'string'], [file_hash, user_did, metadata_str])
+
+def _verify_calldata(file_hash: str) -> bytes:
+    """Encode a verifyDocument(file_hash) call"""
+    return _VERIFY_SELECTOR + encode(['string'], [file_hash])
+
+# Process-wide verification cache keyed by (network, chain_id, file_hash).
+# Unknown documents may be anchored at any time and valid ones may be revoked,
+# but a revocation is final, so each outcome gets its own lifetime.
+_VERIFY_CACHE_NOT_FOUND = TTLCache(maxsize=10_000, ttl=60)
+_VERIFY_CACHE_VALID = TTLCache(maxsize=10_000, ttl=3600)
+_VERIFY_CACHE_REVOKED = LRUCache(maxsize=10_000)
+
+def _get_cached_verification(key: tuple) -> Optional[Dict[str, Any]]:
+    """Return a cached verification result, if any"""
+    for cache in (_VERIFY_CACHE_VALID, _VERIFY_CACHE_REVOKED, _VERIFY_CACHE_NOT_FOUND):
+        result = cache.get(key)
+        if result is not None:
+            return result
+    return None
+
+def _cache_verification(key: tuple, result: Dict[str, Any]):
+    """Cache a verification result with a lifetime matching its outcome"""
+    if not result["verified"]:
+        _VERIFY_CACHE_NOT_FOUND[key] = result
+    elif result["revoked"]:
+        _VERIFY_CACHE_REVOKED[key] = result
+    else:
+        _VERIFY_CACHE_VALID[key] = result
+
+def _invalidate_verification(key: tuple):
+    """Drop any cached verification result after the document changes on-chain"""
+    for cache in (_VERIFY_CACHE_VALID, _VERIFY_CACHE_REVOKED, _VERIFY_CACHE_NOT_FOUND):
+        cache.pop(key, None)
+
+# Network status is polled by dashboards and the demo several times in a row;
+# block number, gas price and balance barely move within a few seconds
+NETWORK_STATUS_TTL = 3  # seconds
+_NETWORK_STATUS_CACHE = TTLCache(maxsize=16, ttl=NETWORK_STATUS_TTL)
+
+# One keep-alive aiohttp session per event loop, shared by every RPC provider
+_HTTP_SESSIONS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = weakref.WeakKeyDictionary()
+
+async def _bind_http_session(w3: AsyncWeb3):
+    """Route a provider's JSON-RPC traffic through the shared pooled session"""
+    loop = asyncio.get_running_loop()
+    session = _HTTP_SESSIONS.get(loop)
+    if session is None or session.closed:
+        session = _HTTP_SESSIONS[loop] = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=60),
+            raise_for_status=True
+        )
+    await w3.provider.cache_async_session(session)
+
+def _make_async_w3(rpc_url: str) -> AsyncWeb3:
+    return AsyncWeb3(AsyncHTTPProvider(
+        rpc_url, request_kwargs={'timeout': aiohttp.ClientTimeout(total=30)}
+    ))
+
+# eth_sendRawTransactionSync (EIP-7966) returns the receipt from the send call.
+# Enabled per network with *_RPC_SYNC_SEND; the node answers error code 4 when
+# the transaction is accepted but not mined within its timeout
+SYNC_SEND_TIMEOUT_CODE = 4
+
+def _receipt_from_rpc(raw_receipt: Dict[str, Any]) -> AttributeDict:
+    """Decode the receipt fields used here from a raw JSON-RPC receipt"""
+    return AttributeDict({
+        'transactionHash': raw_receipt['transactionHash'],
+        'blockNumber': int(raw_receipt['blockNumber'], 16),
+        'gasUsed': int(raw_receipt['gasUsed'], 16),
+        'status': int(raw_receipt['status'], 16)
+    })
+
+# Read-only calls round-robin across the configured RPC endpoints. An endpoint
+# that fails at the transport level (connection error, timeout, 429/5xx) is
+# skipped until its cooldown expires
+RPC_UNHEALTHY_COOLDOWN = 30  # seconds
+_RPC_UNHEALTHY_UNTIL: Dict[str, float] = {}
+_RPC_ROUND_ROBIN = itertools.count()
+# Chain id reported by each fallback endpoint, probed once per process
+_RPC_CHAIN_IDS: Dict[str, int] = {}
+
+def _static_chain_id_middleware(chain_id: int):
+    """Answer eth_chainId locally; web3's validation middleware asks for it on every call"""
+    async def middleware_factory(make_request, w3):
+        async def middleware(method, params):
+            if method == "eth_chainId":
+                return {"jsonrpc": "2.0", "id": 0, "result": hex(chain_id)}
+            return await make_request(method, params)
+        return middleware
+    return middleware_factory
+
+class _NewHeadsWatcher:
+    """
+    Shares one `newHeads` websocket subscription per endpoint so any number of
+    pending transactions can wake up on new blocks instead of polling
+    """
+    
+    RECONNECT_DELAY = 30  # seconds to wait before resubscribing after a failure
+    
+    def __init__(self, ws_url: str):
+        self.ws_url = ws_url
+        self.head_count = 0
+        self._new_head = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._failed_at: Optional[float] = None  # None until the first failure
+    
+    @property
+    def active(self) -> bool:
+        return self._task is not None and not self._task.done()
+    
+    def ensure_running(self):
+        """Start the subscription task unless it is running or recently failed"""
+        if self.active:
+            return
+        if self._failed_at is not None and time.monotonic() - self._failed_at < self.RECONNECT_DELAY:
+            return
+        self._task = asyncio.create_task(self._run())
+    
+    async def _run(self):
+        try:
+            async with AsyncWeb3.persistent_websocket(WebsocketProviderV2(self.ws_url)) as w3:
+                await w3.eth.subscribe("newHeads")
+                async for _ in w3.ws.listen_to_websocket():
+                    self.head_count += 1
+                    self._notify()
+        except Exception as e:
+            logger.warning(f"newHeads subscription to {self.ws_url} failed: {str(e)}")
+        finally:
+            self._failed_at = time.monotonic()
+            # Wake any waiters so they fall back to polling
+            self._notify()
+    
+    def _notify(self):
+        self._new_head.set()
+        self._new_head = asyncio.Event()
+    
+    async def wait_for_head(self, timeout: float) -> bool:
+        """Wait for the next block; returns False on timeout"""
+        try:
+            await asyncio.wait_for(self._new_head.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+_HEAD_WATCHERS: Dict[str, _NewHeadsWatcher] = {}
+
+def _get_head_watcher(ws_url: Optional[str]) -> Optional[_NewHeadsWatcher]:
+    """Return the running newHeads watcher for a websocket URL, if configured"""
+    if not ws_url:
+        return None
+    
+    watcher = _HEAD_WATCHERS.get(ws_url)
+    if watcher is None:
+        watcher = _HEAD_WATCHERS[ws_url] = _NewHeadsWatcher(ws_url)
+    watcher.ensure_running()
+    return watcher if watcher.active else None
+
+class _NonceTracker:
+    """
+    Hands out nonces for one account on one chain from local state. Seeded from
+    the pending transaction count and reconciled against the chain every
+    RECONCILE_BLOCKS new heads (or RECONCILE_INTERVAL seconds without a
+    websocket) to pick up transactions sent by other processes
+    """
+    
+    RECONCILE_BLOCKS = 20
+    RECONCILE_INTERVAL = 300  # seconds, used when no newHeads watcher is running
+    
+    def __init__(self):
+        self._lock = asyncio.Lock()
+        self._next_nonce: Optional[int] = None
+        self._reconciled_head = 0
+        self._reconciled_at = 0.0
+    
+    def _needs_reconcile(self, watcher: Optional[_NewHeadsWatcher]) -> bool:
+        if self._next_nonce is None:
+            return True
+        if watcher is not None:
+            return watcher.head_count - self._reconciled_head >= self.RECONCILE_BLOCKS
+        return time.monotonic() - self._reconciled_at >= self.RECONCILE_INTERVAL
+    
+    async def next_nonce(self, w3: AsyncWeb3, address: str, watcher: Optional[_NewHeadsWatcher]) -> int:
+        """Reserve the next nonce, querying the chain only when seeding or reconciling"""
+        async with self._lock:
+            if self._needs_reconcile(watcher):
+                chain_nonce = await w3.eth.get_transaction_count(address, "pending")
+                # Nonces reserved locally but not yet broadcast are not in the
+                # pending count, so never move backwards here
+                self._next_nonce = max(self._next_nonce or 0, chain_nonce)
+                self._reconciled_head = watcher.head_count if watcher is not None else 0
+                self._reconciled_at = time.monotonic()
+            
+            nonce = self._next_nonce
+            self._next_nonce += 1
+            return nonce
+    
+    def reset(self):
+        """Forget local state so the next reservation re-seeds from the chain"""
+        self._next_nonce = None
+
+_NONCE_TRACKERS: Dict[tuple, _NonceTracker] = {}
+
+def _get_nonce_tracker(address: str, chain_id: int) -> _NonceTracker:
+    tracker = _NONCE_TRACKERS.get((address, chain_id))
+    if tracker is None:
+        tracker = _NONCE_TRACKERS[(address, chain_id)] = _NonceTracker()
+    return tracker
+
+class _MockChain:
+    """
+    In-memory mock blockchain shared by every service instance in the process.
+    With a log path, state is replayed once from the append-only block log
+    (in a worker thread) and every new block is appended to it
+    """
+    
+    def __init__(self, log_path: Optional[str]):
+        self.log_path = log_path
+        self.transactions: Dict[str, Dict[str, Any]] = {}
+        self.documents: Dict[str, Dict[str, Any]] = {}
+        self.blocks: List[Dict[str, Any]] = []
+        self.block_counter = 0
+        self._loaded = not (log_path and os.path.exists(log_path))
+        self._lock = asyncio.Lock()
+    
+    async def ensure_loaded(self):
+        """Replay the block log on first use"""
+        if self._loaded:
+            return
+        async with self._lock:
+            if not self._loaded:
+                await asyncio.to_thread(self._replay_log)
+                self._loaded = True
+    
+    def _replay_log(self):
+        """Rebuild state from the append-only block log (runs in a worker thread)"""
+        with open(self.log_path, 'r') as log_file:
+            for line in log_file:
+                try:
+                    block = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash mid-append can leave a truncated last line
+                    logger.warning("Skipping malformed entry in mock chain log")
+                    continue
+                self._apply_block(block)
+        
+        logger.info(f"Replayed {len(self.blocks)} blocks from mock chain log")
+    
+    def _apply_block(self, block: Dict[str, Any]):
+        """Apply a single block to the in-memory state"""
+        if block['operation'] == 'anchor':
+            self.documents[block['file_hash']] = {
+                'user_did': block['user_did'],
+                'metadata': block['metadata'],
+                'timestamp': block['timestamp'],
+                'revoked': False
+            }
+        
+        self.transactions[block['transaction_hash']] = {
+            'hash': block['transaction_hash'],
+            'block_number': block['block_number'],
+            'gas_used': block['gas_used'],
+            'status': 1
+        }
+        self.blocks.append(block)
+        self.block_counter = max(self.block_counter, block['block_number'] + 1)
+    
+    def _append_log(self, block: Dict[str, Any]):
+        """Append a block to the log file (runs in a worker thread)"""
+        with open(self.log_path, 'a') as log_file:
+            log_file.write(json.dumps(block) + '\n')
+    
+    async def add_block(self, block: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Number, apply and persist a new block; blocks are added one at a time so
+        numbers are unique and the log order matches the chain
+        """
+        await self.ensure_loaded()
+        async with self._lock:
+            block['block_number'] = self.block_counter
+            self._apply_block(block)
+            # Persist off the event loop so durability does not stall requests
+            if self.log_path:
+                await asyncio.to_thread(self._append_log, block)
+        return self.transactions[block['transaction_hash']]
+
+_MOCK_CHAINS: Dict[Optional[str], _MockChain] = {}
+
+def _get_mock_chain(log_path: Optional[str]) -> _MockChain:
+    chain = _MOCK_CHAINS.get(log_path)
+    if chain is None:
+        chain = _MOCK_CHAINS[log_path] = _MockChain(log_path)
+    return chain
+
+# Derived accounts keyed by keccak(private key), so the secp256k1 public key
+# derivation runs once per process rather than once per service instance
+_ACCOUNT_CACHE: Dict[bytes, LocalAccount] = {}
+
+def _load_account(private_key: str) -> LocalAccount:
+    cache_key = Web3.keccak(hexstr=private_key)
+    account = _ACCOUNT_CACHE.get(cache_key)
+    if account is None:
+        account = _ACCOUNT_CACHE[cache_key] = Account.from_key(private_key)
+    return account
+
+@dataclass(slots=True)
+class ChainContext:
+    """Connection state for one Ethereum-compatible network"""
+    network: str
+    w3: AsyncWeb3
+    rpc_pool: List[AsyncWeb3]
+    contract: AsyncContract
+    account: LocalAccount
+    chain_id: int
+    ws_url: Optional[str] = None
+    sync_send: bool = False
+
 class BlockchainService:
     """
     Production-ready blockchain service with security, error handling, and optimization
@@ -80,13 +529,12 @@ class BlockchainService:
     
     def _initialize_connections(self):
         """Initialize blockchain connections with proper error handling"""
+        self.chains: Dict[BlockchainType, ChainContext] = {}
         try:
-            if self.blockchain_type == BlockchainType.ETHEREUM:
-                self._init_ethereum()
-            elif self.blockchain_type == BlockchainType.POLYGON:
-                self._init_polygon()
-            else:
+            if self.blockchain_type == BlockchainType.MOCK:
                 self._init_mock_blockchain()
+            else:
+                self.chains[self.blockchain_type] = self._init_evm(self.blockchain_type)
                 
             logger.info(f"Blockchain service initialized with type: {self.blockchain_type.value}")
             
@@ -97,10 +545,9 @@ class BlockchainService:
     
     def _setup_security(self):
         """Setup security measures"""
-        self._nonce_cache = {}
-        self._transaction_cache = {}
-        self._rate_limit_counter = 0
-        self._last_rate_limit_reset = time.time()
+        self._http_session_bound = False
+        self._rate_limit_tokens = float(RATE_LIMIT_BURST)
+        self._rate_limit_refilled_at = time.monotonic()
         
     def _validate_private_key(self, private_key: str) -> bool:
         """Validate private key format and security"""
@@ -108,40 +555,43 @@ class BlockchainService:
             if not private_key or len(private_key) != 66 or not private_key.startswith('0x'):
                 return False
             
-            # Check if it's a valid hex string
-            int(private_key, 16)
+            # Check if it's a valid hex string of exactly 32 bytes
+            key_bytes = bytes.fromhex(private_key[2:])
+            if len(key_bytes) != 32:
+                return False
             
             # Basic entropy check (should have sufficient randomness)
-            if private_key == '0x' + '0' * 64 or private_key == '0x' + 'f' * 64:
+            if key_bytes == bytes(32) or key_bytes == b'\xff' * 32:
                 return False
                 
             return True
         except (ValueError, TypeError):
             return False
     
-    def _init_ethereum(self):
-        """Initialize Ethereum connection with security measures"""
+    def _init_evm(self, blockchain_type: BlockchainType) -> ChainContext:
+        """Initialize an Ethereum or Polygon connection with security measures"""
+        network_name = blockchain_type.value.title()
+        prefix = blockchain_type.value.upper()
         try:
-            rpc_url = getattr(settings, 'ETHEREUM_RPC_URL', None)
+            rpc_url = getattr(settings, f'{prefix}_RPC_URL', None)
             if not rpc_url or 'YOUR_PROJECT_ID' in rpc_url:
-                raise BlockchainError("Ethereum RPC URL not properly configured")
+                raise BlockchainError(f"{network_name} RPC URL not properly configured")
             
             # Validate RPC URL
             if not rpc_url.startswith(('http://', 'https://')):
                 raise BlockchainError("Invalid RPC URL format")
             
-            self.ethereum_w3 = Web3(Web3.HTTPProvider(rpc_url, request_kwargs={'timeout': 30}))
-            
-            if not self.ethereum_w3.is_connected():
-                raise BlockchainError("Failed to connect to Ethereum network")
+            w3 = _make_async_w3(rpc_url)
+            chain_id = self._probe_rpc(rpc_url, network_name)
+            rpc_pool = self._build_rpc_pool(w3, chain_id, getattr(settings, f'{prefix}_RPC_FALLBACK_URLS', None))
             
             # Setup account with security validation
             private_key = getattr(settings, 'PRIVATE_KEY', None)
             if not private_key or not self._validate_private_key(private_key):
                 raise BlockchainError("Invalid or missing private key")
             
-            self.account = Account.from_key(private_key)
-            self.ethereum_w3.eth.default_account = self.account.address
+            account = _load_account(private_key)
+            w3.eth.default_account = account.address
             
             # Setup contract with validation
             contract_address = getattr(settings, 'CONTRACT_ADDRESS', None)
@@ -152,147 +602,157 @@ class BlockchainService:
             if not Web3.is_address(contract_address):
                 raise BlockchainError("Invalid contract address format")
             
-            self.contract = self.ethereum_w3.eth.contract(
+            contract = w3.eth.contract(
                 address=contract_address,
-                abi=self._get_contract_abi()
+                abi=_CONTRACT_ABI
             )
             
             # Verify contract exists and has required functions
-            self._verify_contract_functions()
-            
-            logger.info(f"Ethereum connection established. Account: {self.account.address}")
-            
-        except Exception as e:
-            logger.error(f"Ethereum initialization failed: {str(e)}")
-            raise BlockchainError(f"Ethereum initialization failed: {str(e)}")
-    
-    def _init_polygon(self):
-        """Initialize Polygon connection with security measures"""
-        try:
-            rpc_url = getattr(settings, 'POLYGON_RPC_URL', None)
-            if not rpc_url or 'YOUR_PROJECT_ID' in rpc_url:
-                raise BlockchainError("Polygon RPC URL not properly configured")
-            
-            self.polygon_w3 = Web3(Web3.HTTPProvider(rpc_url, request_kwargs={'timeout': 30}))
-            
-            if not self.polygon_w3.is_connected():
-                raise BlockchainError("Failed to connect to Polygon network")
-            
-            # Setup account with security validation
-            private_key = getattr(settings, 'PRIVATE_KEY', None)
-            if not private_key or not self._validate_private_key(private_key):
-                raise BlockchainError("Invalid or missing private key")
-            
-            self.account = Account.from_key(private_key)
-            self.polygon_w3.eth.default_account = self.account.address
-            
-            # Setup contract with validation
-            contract_address = getattr(settings, 'CONTRACT_ADDRESS', None)
-            if not contract_address or contract_address == '0x0000000000000000000000000000000000000000':
-                raise BlockchainError("Invalid contract address")
-            
-            self.contract = self.polygon_w3.eth.contract(
-                address=contract_address,
-                abi=self._get_contract_abi()
+            self._verify_contract_functions(contract, chain_id)
+            
+            logger.info(f"{network_name} connection established. Account: {account.address}")
+            
+            return ChainContext(
+                network=blockchain_type.value,
+                w3=w3,
+                rpc_pool=rpc_pool,
+                contract=contract,
+                account=account,
+                chain_id=chain_id,
+                ws_url=getattr(settings, f'{prefix}_WS_URL', None),
+                sync_send=bool(getattr(settings, f'{prefix}_RPC_SYNC_SEND', False))
             )
             
-            # Verify contract exists and has required functions
-            self._verify_contract_functions()
-            
-            logger.info(f"Polygon connection established. Account: {self.account.address}")
-            
         except Exception as e:
-            logger.error(f"Polygon initialization failed: {str(e)}")
-            raise BlockchainError(f"Polygon initialization failed: {str(e)}")
+            logger.error(f"{network_name} initialization failed: {str(e)}")
+            raise BlockchainError(f"{network_name} initialization failed: {str(e)}")
+    
+    def _probe_rpc(self, rpc_url: str, network_name: str) -> int:
+        """Check connectivity once at startup and return the chain id"""
+        probe_w3 = Web3(Web3.HTTPProvider(rpc_url, request_kwargs={'timeout': 30}))
+        
+        if not probe_w3.is_connected():
+            raise BlockchainError(f"Failed to connect to {network_name} network")
+        
+        return probe_w3.eth.chain_id
+    
+    def _build_rpc_pool(self, primary_w3: AsyncWeb3, chain_id: int, fallback_urls: Optional[str]) -> List[AsyncWeb3]:
+        """Pair the primary provider with any comma-separated fallback endpoints on the same chain"""
+        pool = [primary_w3]
+        for url in (fallback_urls or '').split(','):
+            url = url.strip()
+            if url and self._check_fallback_rpc(url, chain_id):
+                pool.append(_make_async_w3(url))
+        
+        # Only after every member is known to serve chain_id may eth_chainId be answered locally
+        for w3 in pool:
+            w3.middleware_onion.add(_static_chain_id_middleware(chain_id), 'static_chain_id')
+        return pool
+    
+    def _check_fallback_rpc(self, url: str, chain_id: int) -> bool:
+        """Accept a fallback endpoint only if it is HTTP(S) and serves the primary's chain"""
+        if not url.startswith(('http://', 'https://')):
+            logger.warning(f"Ignoring fallback RPC endpoint {url}: invalid URL format")
+            return False
+        
+        fallback_chain_id = _RPC_CHAIN_IDS.get(url)
+        if fallback_chain_id is None:
+            # An endpoint that failed its probe is left out until its cooldown
+            # expires, so pools built meanwhile don't wait on it again
+            if _RPC_UNHEALTHY_UNTIL.get(url, 0) > time.monotonic():
+                return False
+            try:
+                fallback_chain_id = Web3(Web3.HTTPProvider(url, request_kwargs={'timeout': 10})).eth.chain_id
+            except Exception as e:
+                _RPC_UNHEALTHY_UNTIL[url] = time.monotonic() + RPC_UNHEALTHY_COOLDOWN
+                logger.warning(f"Ignoring fallback RPC endpoint {url}: chain id probe failed: {str(e)}")
+                return False
+            _RPC_CHAIN_IDS[url] = fallback_chain_id
+            if fallback_chain_id != chain_id:
+                logger.error(f"Ignoring fallback RPC endpoint {url}: chain id {fallback_chain_id} does not match {chain_id}")
+        
+        return fallback_chain_id == chain_id
+    
+    async def _ensure_http_session(self):
+        """Attach the shared keep-alive session before the first RPC call"""
+        if self.blockchain_type == BlockchainType.MOCK or self._http_session_bound:
+            return
+        
+        for w3 in self.chains[self.blockchain_type].rpc_pool:
+            await _bind_http_session(w3)
+        self._http_session_bound = True
+    
+    async def _call_read_rpc(self, ctx: ChainContext, request):
+        """
+        Run a read-only request against the RPC pool, starting from the next
+        endpoint in round-robin order and failing over on transport errors.
+        Transactions always go through the primary provider so nonces stay
+        consistent until confirmation
+        """
+        pool = ctx.rpc_pool
+        start = next(_RPC_ROUND_ROBIN)
+        ordered = [pool[(start + i) % len(pool)] for i in range(len(pool))]
+        
+        now = time.monotonic()
+        healthy = [w3 for w3 in ordered if _RPC_UNHEALTHY_UNTIL.get(w3.provider.endpoint_uri, 0) <= now]
+        
+        last_error = None
+        for w3 in healthy or ordered:
+            try:
+                return await request(w3)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                endpoint = w3.provider.endpoint_uri
+                _RPC_UNHEALTHY_UNTIL[endpoint] = time.monotonic() + RPC_UNHEALTHY_COOLDOWN
+                logger.warning(f"RPC endpoint {endpoint} failed: {str(e)}. Trying next endpoint.")
+                last_error = e
+        raise last_error
     
     def _init_mock_blockchain(self):
         """Initialize mock blockchain for development/testing"""
         logger.info("Initializing mock blockchain for development")
-        self._mock_transactions = {}
-        self._mock_documents = {}
-        self._mock_blocks = []
-        self._block_counter = 0
-        self._mock_nonce = 0
-    
-    def _get_contract_abi(self) -> List[Dict]:
-        """Get enhanced contract ABI with security features"""
-        return [
-            {
-                "inputs": [
-                    {"internalType": "string", "name": "documentHash", "type": "string"},
-                    {"internalType": "string", "name": "userDid", "type": "string"},
-                    {"internalType": "string", "name": "metadata", "type": "string"}
-                ],
-                "name": "anchorDocument",
-                "outputs": [{"internalType": "bool", "name": "", "type": "bool"}],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [{"internalType": "string", "name": "documentHash", "type": "string"}],
-                "name": "verifyDocument",
-                "outputs": [
-                    {"internalType": "bool", "name": "exists", "type": "bool"},
-                    {"internalType": "string", "name": "userDid", "type": "string"},
-                    {"internalType": "uint256", "name": "timestamp", "type": "uint256"},
-                    {"internalType": "string", "name": "metadata", "type": "string"},
-                    {"internalType": "bool", "name": "revoked", "type": "bool"}
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {"internalType": "string", "name": "documentHash", "type": "string"},
-                    {"internalType": "string", "name": "reason", "type": "string"}
-                ],
-                "name": "revokeDocument",
-                "outputs": [{"internalType": "bool", "name": "", "type": "bool"}],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [{"internalType": "string", "name": "documentHash", "type": "string"}],
-                "name": "getDocumentHistory",
-                "outputs": [
-                    {"internalType": "uint256[]", "name": "timestamps", "type": "uint256[]"},
-                    {"internalType": "string[]", "name": "actions", "type": "string[]"}
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            }
-        ]
+        self._mock_chain = _get_mock_chain(getattr(settings, 'MOCK_CHAIN_LOG_PATH', None))
     
-    def _verify_contract_functions(self):
+    def _verify_contract_functions(self, contract: AsyncContract, chain_id: int):
         """Verify that contract has all required functions"""
+        cache_key = (chain_id, contract.address.lower(), _CONTRACT_ABI_DIGEST)
+        if cache_key in _VERIFIED_CONTRACTS:
+            return
+        
         required_functions = ['anchorDocument', 'verifyDocument', 'revokeDocument']
         
         for func_name in required_functions:
-            if not hasattr(self.contract.functions, func_name):
+            if not hasattr(contract.functions, func_name):
                 raise BlockchainError(f"Contract missing required function: {func_name}")
+        
+        _VERIFIED_CONTRACTS.add(cache_key)
     
     def _validate_inputs(self, file_hash: str, user_did: str, metadata: Optional[Dict] = None):
         """Validate input parameters"""
-        if not file_hash or len(file_hash) != 64:
-            raise BlockchainError("Invalid file hash: must be 64 character hex string")
+        if not file_hash or not _HASH_RE.fullmatch(file_hash):
+            raise ValidationError("Invalid file hash: must be 64 character hex string")
         
         if not user_did or len(user_did) < 10:
-            raise BlockchainError("Invalid user DID: must be at least 10 characters")
+            raise ValidationError("Invalid user DID: must be at least 10 characters")
         
         if metadata and not isinstance(metadata, dict):
-            raise BlockchainError("Metadata must be a dictionary")
+            raise ValidationError("Metadata must be a dictionary")
         
         # Validate metadata size (prevent gas limit issues)
         if metadata:
-            metadata_str = json.dumps(metadata)
-            if len(metadata_str) > 10000:  # 10KB limit
-                raise BlockchainError("Metadata too large: maximum 10KB")
+            metadata_bytes = orjson.dumps(metadata)
+            if len(metadata_bytes) > 10000:  # 10KB limit
+                raise ValidationError("Metadata too large: maximum 10KB")
+    
+    def validate_many(self, file_hashes: List[str]) -> List[bool]:
+        """Check many file hashes at once, returning a validity mask in input order"""
+        fullmatch = _HASH_RE.fullmatch
+        return [bool(file_hash) and fullmatch(file_hash) is not None for file_hash in file_hashes]
     
-    def _estimate_gas_optimized(self, w3: Web3, contract_func, *args) -> int:
+    async def _estimate_gas_optimized(self, w3: AsyncWeb3, call: Dict[str, Any]) -> int:
         """Estimate gas with optimization and fallback"""
         try:
-            # Try to estimate gas
-            estimated_gas = contract_func(*args).estimate_gas()
+            # Try to estimate gas for the pre-encoded call
+            estimated_gas = await w3.eth.estimate_gas(call)
             
             # Add buffer for safety (20% buffer)
             gas_with_buffer = int(estimated_gas * 1.2)
@@ -307,11 +767,11 @@ class BlockchainService:
             logger.warning(f"Gas estimation failed: {str(e)}. Using default values.")
             return 300000  # Default gas limit
     
-    def _get_optimal_gas_price(self, w3: Web3) -> int:
+    async def _get_optimal_gas_price(self, w3: AsyncWeb3) -> int:
         """Get optimal gas price with fallback"""
         try:
             # Get current gas price
-            current_gas_price = w3.eth.gas_price
+            current_gas_price = await w3.eth.gas_price
             
             # Add 10% buffer for faster confirmation
             optimal_gas_price = int(current_gas_price * 1.1)
@@ -326,26 +786,10 @@ class BlockchainService:
             logger.warning(f"Gas price estimation failed: {str(e)}. Using default.")
             return w3.to_wei(20, 'gwei')  # Default 20 gwei
     
-    def _get_nonce(self, w3: Web3, address: str) -> int:
-        """Get nonce with caching to prevent nonce issues"""
-        cache_key = f"{address}_{w3.eth.chain_id}"
-        
-        if cache_key in self._nonce_cache:
-            cached_nonce = self._nonce_cache[cache_key]
-            # Use cached nonce if it's recent (within 5 minutes)
-            if time.time() - cached_nonce.get('timestamp', 0) < 300:
-                return cached_nonce['nonce']
-        
-        # Get fresh nonce
-        nonce = w3.eth.get_transaction_count(address)
-        
-        # Cache the nonce
-        self._nonce_cache[cache_key] = {
-            'nonce': nonce,
-            'timestamp': time.time()
-        }
-        
-        return nonce
+    async def _get_nonce(self, ctx: ChainContext) -> int:
+        """Reserve the next nonce from the process-wide local tracker"""
+        tracker = _get_nonce_tracker(ctx.account.address, ctx.chain_id)
+        return await tracker.next_nonce(ctx.w3, ctx.account.address, _get_head_watcher(ctx.ws_url))
     
     @retry_on_failure(max_retries=3, delay=2.0)
     async def anchor_document(self, file_hash: str, user_did: str, metadata: Optional[Dict] = None) -> Dict[str, Any]:
@@ -358,107 +802,55 @@ class BlockchainService:
             
             # Rate limiting
             self._check_rate_limit()
+            await self._ensure_http_session()
             
-            if self.blockchain_type == BlockchainType.ETHEREUM:
-                return await self._anchor_document_ethereum(file_hash, user_did, metadata)
-            elif self.blockchain_type == BlockchainType.POLYGON:
-                return await self._anchor_document_polygon(file_hash, user_did, metadata)
-            else:
+            if self.blockchain_type == BlockchainType.MOCK:
                 return await self._anchor_document_mock(file_hash, user_did, metadata)
+            return await self._anchor_document_evm(self.chains[self.blockchain_type], file_hash, user_did, metadata)
                 
+        except ValidationError:
+            raise
         except Exception as e:
             logger.error(f"Error anchoring document to blockchain: {str(e)}")
             raise BlockchainError(f"Blockchain anchoring failed: {str(e)}")
     
-    async def _anchor_document_ethereum(self, file_hash: str, user_did: str, metadata: Optional[Dict] = None) -> Dict[str, Any]:
-        """Anchor document to Ethereum with enhanced security"""
+    async def _anchor_document_evm(self, ctx: ChainContext, file_hash: str, user_did: str, metadata: Optional[Dict] = None) -> Dict[str, Any]:
+        """Anchor document to Ethereum or Polygon with enhanced security"""
+        network_name = ctx.network.title()
         try:
-            if not self.ethereum_w3 or not self.contract:
-                raise BlockchainError("Ethereum connection not established")
-            
             # Prepare transaction data
-            metadata_str = json.dumps(metadata or {})
-            
-            # Build transaction with optimized gas estimation
-            contract_func = self.contract.functions.anchorDocument(file_hash, user_did, metadata_str)
-            
-            gas_limit = self._estimate_gas_optimized(self.ethereum_w3, contract_func)
-            gas_price = self._get_optimal_gas_price(self.ethereum_w3)
-            nonce = self._get_nonce(self.ethereum_w3, self.account.address)
-            
-            transaction = contract_func.build_transaction({
-                'from': self.account.address,
-                'gas': gas_limit,
-                'gasPrice': gas_price,
-                'nonce': nonce,
-            })
-            
-            # Sign transaction
-            signed_txn = self.ethereum_w3.eth.account.sign_transaction(transaction, settings.PRIVATE_KEY)
-            
-            # Send transaction
-            tx_hash = self.ethereum_w3.eth.send_raw_transaction(signed_txn.rawTransaction)
-            
-            # Wait for transaction receipt with timeout
-            tx_receipt = await self._wait_for_transaction_receipt(self.ethereum_w3, tx_hash, timeout=300)
-            
-            # Update nonce cache
-            self._nonce_cache[f"{self.account.address}_{self.ethereum_w3.eth.chain_id}"]['nonce'] = nonce + 1
-            
-            logger.info(f"Document anchored to Ethereum: {file_hash}, TX: {tx_hash.hex()}")
-            
-            return {
-                "transaction_hash": tx_hash.hex(),
-                "block_number": tx_receipt.blockNumber,
-                "blockchain_hash": file_hash,
-                "status": "confirmed",
-                "timestamp": datetime.utcnow().isoformat(),
-                "gas_used": tx_receipt.gasUsed,
-                "gas_price": gas_price,
-                "network": "ethereum",
-                "chain_id": self.ethereum_w3.eth.chain_id
+            call = {
+                'from': ctx.account.address,
+                'to': ctx.contract.address,
+                'data': _anchor_calldata(file_hash, user_did, metadata),
             }
             
-        except Exception as e:
-            logger.error(f"Ethereum anchoring failed: {str(e)}")
-            raise TransactionError(f"Ethereum transaction failed: {str(e)}")
-    
-    async def _anchor_document_polygon(self, file_hash: str, user_did: str, metadata: Optional[Dict] = None) -> Dict[str, Any]:
-        """Anchor document to Polygon with enhanced security"""
-        try:
-            if not self.polygon_w3 or not self.contract:
-                raise BlockchainError("Polygon connection not established")
-            
-            # Prepare transaction data
-            metadata_str = json.dumps(metadata or {})
-            
-            # Build transaction with optimized gas estimation
-            contract_func = self.contract.functions.anchorDocument(file_hash, user_did, metadata_str)
-            
-            gas_limit = self._estimate_gas_optimized(self.polygon_w3, contract_func)
-            gas_price = self._get_optimal_gas_price(self.polygon_w3)
-            nonce = self._get_nonce(self.polygon_w3, self.account.address)
+            # Gas limit, gas price and nonce are independent; fetch them concurrently
+            gas_limit, gas_price, nonce = await asyncio.gather(
+                self._estimate_gas_optimized(ctx.w3, call),
+                self._get_optimal_gas_price(ctx.w3),
+                self._get_nonce(ctx),
+            )
             
-            transaction = contract_func.build_transaction({
-                'from': self.account.address,
+            transaction = {
+                **call,
+                'value': 0,
                 'gas': gas_limit,
                 'gasPrice': gas_price,
                 'nonce': nonce,
-            })
+                'chainId': ctx.chain_id,
+            }
             
             # Sign transaction
-            signed_txn = self.polygon_w3.eth.account.sign_transaction(transaction, settings.PRIVATE_KEY)
-            
-            # Send transaction
-            tx_hash = self.polygon_w3.eth.send_raw_transaction(signed_txn.rawTransaction)
+            signed_txn = ctx.account.sign_transaction(transaction)
             
-            # Wait for transaction receipt with timeout
-            tx_receipt = await self._wait_for_transaction_receipt(self.polygon_w3, tx_hash, timeout=300)
+            # Send transaction and wait for its receipt
+            tx_hash, tx_receipt = await self._send_and_confirm(ctx, signed_txn, timeout=300)
             
-            # Update nonce cache
-            self._nonce_cache[f"{self.account.address}_{self.polygon_w3.eth.chain_id}"]['nonce'] = nonce + 1
+            # A cached "not found" for this document is now stale
+            _invalidate_verification((ctx.network, ctx.chain_id, file_hash))
             
-            logger.info(f"Document anchored to Polygon: {file_hash}, TX: {tx_hash.hex()}")
+            logger.info(f"Document anchored to {network_name}: {file_hash}, TX: {tx_hash.hex()}")
             
             return {
                 "transaction_hash": tx_hash.hex(),
@@ -468,38 +860,34 @@ class BlockchainService:
                 "timestamp": datetime.utcnow().isoformat(),
                 "gas_used": tx_receipt.gasUsed,
                 "gas_price": gas_price,
-                "network": "polygon",
-                "chain_id": self.polygon_w3.eth.chain_id
+                "network": ctx.network,
+                "chain_id": ctx.chain_id
             }
             
         except Exception as e:
-            logger.error(f"Polygon anchoring failed: {str(e)}")
-            raise TransactionError(f"Polygon transaction failed: {str(e)}")
+            logger.error(f"{network_name} anchoring failed: {str(e)}")
+            raise TransactionError(f"{network_name} transaction failed: {str(e)}")
     
     async def _anchor_document_mock(self, file_hash: str, user_did: str, metadata: Optional[Dict] = None) -> Dict[str, Any]:
         """Anchor document to mock blockchain"""
         try:
             # Simulate blockchain transaction
-            tx_hash = hashlib.sha256(f"{file_hash}{user_did}{time.time()}".encode()).hexdigest()
-            
-            # Store document data
-            self._mock_documents[file_hash] = {
+            tx_hasher = hashlib.blake2b(bytes.fromhex(file_hash), digest_size=32)
+            tx_hasher.update(time.time_ns().to_bytes(8, 'big'))
+            tx_hasher.update(user_did.encode())
+            tx_hash = tx_hasher.hexdigest()
+            
+            # Record the block and apply it to the shared document/transaction state
+            block = {
+                'operation': 'anchor',
+                'transaction_hash': tx_hash,
+                'file_hash': file_hash,
                 'user_did': user_did,
                 'metadata': metadata or {},
                 'timestamp': datetime.utcnow().isoformat(),
-                'revoked': False
-            }
-            
-            # Create mock transaction
-            mock_tx = {
-                'hash': tx_hash,
-                'block_number': self._block_counter,
-                'gas_used': 100000,
-                'status': 1
+                'gas_used': 100000
             }
-            
-            self._mock_transactions[tx_hash] = mock_tx
-            self._block_counter += 1
+            mock_tx = await self._mock_chain.add_block(block)
             
             logger.info(f"Document anchored to mock blockchain: {file_hash}, TX: {tx_hash}")
             
@@ -517,38 +905,107 @@ class BlockchainService:
             logger.error(f"Mock anchoring failed: {str(e)}")
             raise TransactionError(f"Mock transaction failed: {str(e)}")
     
-    async def _wait_for_transaction_receipt(self, w3: Web3, tx_hash: bytes, timeout: int = 300) -> Dict:
-        """Wait for transaction receipt with timeout and error handling"""
-        start_time = time.time()
+    async def _send_and_confirm(self, ctx: ChainContext, signed_txn, timeout: int = 300) -> tuple:
+        """
+        Broadcast a signed transaction and return (tx_hash, receipt). Endpoints
+        that support eth_sendRawTransactionSync return the receipt from the send
+        itself; otherwise the receipt is awaited after a normal send.
         
-        while time.time() - start_time < timeout:
+        Only an explicit JSON-RPC rejection is raised straight away (and frees the
+        nonce). After a transport failure the node may already have the
+        transaction, so the same signed bytes are re-sent and its receipt
+        awaited; raising instead would let a retry re-sign and anchor twice.
+        """
+        tx_hash = signed_txn.hash
+        try:
+            if ctx.sync_send:
+                raw_receipt = await ctx.w3.manager.coro_request(
+                    "eth_sendRawTransactionSync", [signed_txn.rawTransaction.hex()]
+                )
+                tx_receipt = _receipt_from_rpc(raw_receipt)
+                if tx_receipt.status == 0:
+                    raise TransactionError("Transaction failed on blockchain")
+                return tx_hash, tx_receipt
+            
+            tx_hash = await ctx.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
+        except TransactionError:
+            raise
+        except Exception as e:
+            # web3 raises JSON-RPC error responses with the error object as the
+            # first argument (ValueError, or MethodUnavailable for -32601)
+            rpc_error = e.args[0] if e.args and isinstance(e.args[0], dict) else None
+            if rpc_error is None:
+                logger.warning(f"Send of {tx_hash.hex()} failed in transport: {str(e)}. Re-sending and waiting for its receipt")
+                await self._rebroadcast(ctx, signed_txn)
+            elif ctx.sync_send and rpc_error.get('code') == SYNC_SEND_TIMEOUT_CODE:
+                # Accepted but not mined within the node's own timeout; keep waiting
+                logger.info(f"Sync send timed out on the node; waiting for receipt of {tx_hash.hex()}")
+            else:
+                # A rejected send leaves a gap in the local nonces
+                _get_nonce_tracker(ctx.account.address, ctx.chain_id).reset()
+                raise
+        
+        try:
+            return tx_hash, await self._wait_for_transaction_receipt(ctx, tx_hash, timeout=timeout)
+        except TransactionError:
+            # Re-seed from the pending count: it still covers the transaction if
+            # the node has it, and frees the nonce if the send never arrived
+            _get_nonce_tracker(ctx.account.address, ctx.chain_id).reset()
+            raise
+    
+    async def _rebroadcast(self, ctx: ChainContext, signed_txn):
+        """Re-send identical signed bytes; harmless if the node already has them"""
+        try:
+            await ctx.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
+        except Exception as e:
+            # Typically "already known" when the first send got through
+            logger.debug(f"Re-send of {signed_txn.hash.hex()} failed: {str(e)}")
+    
+    async def _wait_for_transaction_receipt(self, ctx: ChainContext, tx_hash: bytes, timeout: int = 300) -> Dict:
+        """
+        Wait for transaction receipt with timeout and error handling.
+        Checks on every new block when a websocket endpoint is configured,
+        otherwise polls every 2 seconds.
+        """
+        deadline = time.monotonic() + timeout
+        
+        while time.monotonic() < deadline:
             try:
-                receipt = w3.eth.get_transaction_receipt(tx_hash)
-                if receipt:
-                    if receipt.status == 0:
-                        raise TransactionError("Transaction failed on blockchain")
-                    return receipt
+                receipt = await ctx.w3.eth.get_transaction_receipt(tx_hash)
+            except TransactionNotFound:
+                receipt = None
             except Exception as e:
-                logger.debug(f"Transaction not yet mined: {str(e)}")
-            
-            await asyncio.sleep(2)
+                logger.debug(f"Receipt lookup failed: {str(e)}")
+                receipt = None
+            
+            if receipt:
+                if receipt.status == 0:
+                    raise TransactionError("Transaction failed on blockchain")
+                return receipt
+            
+            remaining = deadline - time.monotonic()
+            watcher = _get_head_watcher(ctx.ws_url)
+            if watcher:
+                # Re-check on the next block; the timeout guards against a stalled socket
+                await watcher.wait_for_head(min(remaining, 30))
+            else:
+                await asyncio.sleep(min(remaining, 2))
         
         raise TransactionError(f"Transaction timeout after {timeout} seconds")
     
     def _check_rate_limit(self):
-        """Implement rate limiting for blockchain operations"""
-        current_time = time.time()
+        """Token-bucket rate limiting for blockchain operations"""
+        current_time = time.monotonic()
         
-        # Reset counter if more than 1 minute has passed
-        if current_time - self._last_rate_limit_reset > 60:
-            self._rate_limit_counter = 0
-            self._last_rate_limit_reset = current_time
+        # Refill continuously (10 tokens per minute) instead of resetting a fixed window
+        elapsed = current_time - self._rate_limit_refilled_at
+        self._rate_limit_tokens = min(RATE_LIMIT_BURST, self._rate_limit_tokens + elapsed * RATE_LIMIT_BURST / 60)
+        self._rate_limit_refilled_at = current_time
         
-        # Check rate limit (max 10 transactions per minute)
-        if self._rate_limit_counter >= 10:
+        if self._rate_limit_tokens < 1:
             raise BlockchainError("Rate limit exceeded: maximum 10 transactions per minute")
         
-        self._rate_limit_counter += 1
+        self._rate_limit_tokens -= 1
     
     @retry_on_failure(max_retries=3, delay=1.0)
     async def verify_document(self, file_hash: str) -> Dict[str, Any]:
@@ -556,188 +1013,218 @@ class BlockchainService:
         Verify document on blockchain with enhanced error handling
         """
         try:
-            if not file_hash or len(file_hash) != 64:
-                raise BlockchainError("Invalid file hash")
+            if not file_hash or not _HASH_RE.fullmatch(file_hash):
+                raise ValidationError("Invalid file hash")
             
-            if self.blockchain_type == BlockchainType.ETHEREUM:
-                return await self._verify_document_ethereum(file_hash)
-            elif self.blockchain_type == BlockchainType.POLYGON:
-                return await self._verify_document_polygon(file_hash)
-            else:
+            await self._ensure_http_session()
+            
+            if self.blockchain_type == BlockchainType.MOCK:
                 return await self._verify_document_mock(file_hash)
+            return await self._verify_document_cached(self.chains[self.blockchain_type], file_hash)
                 
+        except ValidationError:
+            raise
         except Exception as e:
             logger.error(f"Error verifying document: {str(e)}")
             raise BlockchainError(f"Document verification failed: {str(e)}")
     
-    async def _verify_document_ethereum(self, file_hash: str) -> Dict[str, Any]:
-        """Verify document on Ethereum"""
+    async def _verify_document_cached(self, ctx: ChainContext, file_hash: str) -> Dict[str, Any]:
+        """Serve a verification from the process-wide cache, calling the chain on a miss"""
+        key = (ctx.network, ctx.chain_id, file_hash)
+        
+        result = _get_cached_verification(key)
+        if result is None:
+            result = await self._verify_document_evm(ctx, file_hash)
+            _cache_verification(key, result)
+        
+        return result
+    
+    async def _verify_document_evm(self, ctx: ChainContext, file_hash: str) -> Dict[str, Any]:
+        """Verify document on Ethereum or Polygon"""
+        network_name = ctx.network.title()
         try:
-            if not self.ethereum_w3 or not self.contract:
-                raise BlockchainError("Ethereum connection not established")
-            
             # Call contract function
-            result = self.contract.functions.verifyDocument(file_hash).call()
+            result = await self._call_read_rpc(ctx, lambda w3: self._call_verify_document(w3, ctx.contract.address, file_hash))
             
-            exists, user_did, timestamp, metadata_str, revoked = result
-            
-            if not exists:
-                return {
-                    "verified": False,
-                    "error": "Document not found on blockchain"
-                }
-            
-            # Parse metadata
-            try:
-                metadata = json.loads(metadata_str) if metadata_str else {}
-            except json.JSONDecodeError:
-                metadata = {}
-            
-            return {
-                "verified": True,
-                "user_did": user_did,
-                "timestamp": datetime.fromtimestamp(timestamp).isoformat(),
-                "metadata": metadata,
-                "revoked": revoked,
-                "network": "ethereum",
-                "chain_id": self.ethereum_w3.eth.chain_id
-            }
+            return self._format_verification(result, ctx.network, ctx.chain_id)
             
         except Exception as e:
-            logger.error(f"Ethereum verification failed: {str(e)}")
-            raise BlockchainError(f"Ethereum verification failed: {str(e)}")
+            logger.error(f"{network_name} verification failed: {str(e)}")
+            raise BlockchainError(f"{network_name} verification failed: {str(e)}")
     
-    async def _verify_document_polygon(self, file_hash: str) -> Dict[str, Any]:
-        """Verify document on Polygon"""
+    async def _call_verify_document(self, w3: AsyncWeb3, contract_address: str, file_hash: str) -> tuple:
+        """Call verifyDocument with pre-encoded calldata, bypassing the contract wrapper"""
+        return_data = await w3.eth.call({
+            'to': contract_address,
+            'data': _verify_calldata(file_hash),
+        })
+        return decode(_VERIFY_OUTPUT_TYPES, return_data)
+    
+    def _format_verification(self, result: tuple, network: str, chain_id: int) -> Dict[str, Any]:
+        """Build the verification response from a verifyDocument result tuple"""
+        exists, user_did, timestamp, metadata_str, revoked = result
+        
+        if not exists:
+            return dict(_NOT_FOUND)
+        
+        # Parse metadata
         try:
-            if not self.polygon_w3 or not self.contract:
-                raise BlockchainError("Polygon connection not established")
-            
-            # Call contract function
-            result = self.contract.functions.verifyDocument(file_hash).call()
-            
-            exists, user_did, timestamp, metadata_str, revoked = result
-            
-            if not exists:
-                return {
-                    "verified": False,
-                    "error": "Document not found on blockchain"
-                }
-            
-            # Parse metadata
-            try:
-                metadata = json.loads(metadata_str) if metadata_str else {}
-            except json.JSONDecodeError:
-                metadata = {}
+            metadata = json.loads(metadata_str) if metadata_str else {}
+        except json.JSONDecodeError:
+            metadata = {}
+        
+        return {
+            "verified": True,
+            "user_did": user_did,
+            "timestamp": datetime.fromtimestamp(timestamp).isoformat(),
+            "metadata": metadata,
+            "revoked": revoked,
+            "network": network,
+            "chain_id": chain_id
+        }
+    
+    @retry_on_failure(max_retries=3, delay=1.0)
+    async def verify_documents(self, file_hashes: List[str]) -> List[Dict[str, Any]]:
+        """
+        Verify many documents at once, returning one verify_document-shaped
+        result per hash in the same order
+        """
+        try:
+            mask = self.validate_many(file_hashes)
+            if not all(mask):
+                raise ValidationError(f"Invalid file hash: {file_hashes[mask.index(False)]}")
             
-            return {
-                "verified": True,
-                "user_did": user_did,
-                "timestamp": datetime.fromtimestamp(timestamp).isoformat(),
-                "metadata": metadata,
-                "revoked": revoked,
-                "network": "polygon",
-                "chain_id": self.polygon_w3.eth.chain_id
-            }
+            await self._ensure_http_session()
             
+            if self.blockchain_type == BlockchainType.MOCK:
+                await self._mock_chain.ensure_loaded()
+                return self._verify_documents_mock(file_hashes)
+            return await self._verify_documents_evm(self.chains[self.blockchain_type], file_hashes)
+                
+        except ValidationError:
+            raise
+        except Exception as e:
+            logger.error(f"Error verifying documents: {str(e)}")
+            raise BlockchainError(f"Batch verification failed: {str(e)}")
+    
+    async def _verify_documents_evm(self, ctx: ChainContext, file_hashes: List[str]) -> List[Dict[str, Any]]:
+        """Verify documents with one Multicall3 eth_call per batch, falling back to single calls"""
+        results = {}
+        for file_hash in file_hashes:
+            cached = _get_cached_verification((ctx.network, ctx.chain_id, file_hash))
+            if cached is not None:
+                results[file_hash] = cached
+        misses = [file_hash for file_hash in dict.fromkeys(file_hashes) if file_hash not in results]
+        
+        try:
+            for start in range(0, len(misses), MULTICALL_BATCH_SIZE):
+                batch = misses[start:start + MULTICALL_BATCH_SIZE]
+                calls = [
+                    (ctx.contract.address, False, _verify_calldata(file_hash))
+                    for file_hash in batch
+                ]
+                call_results = await self._call_read_rpc(
+                    ctx, lambda rpc: rpc.eth.contract(address=MULTICALL3_ADDRESS, abi=_MULTICALL3_ABI).functions.aggregate3(calls).call()
+                )
+                for file_hash, (_, return_data) in zip(batch, call_results):
+                    result = self._format_verification(decode(_VERIFY_OUTPUT_TYPES, return_data), ctx.network, ctx.chain_id)
+                    _cache_verification((ctx.network, ctx.chain_id, file_hash), result)
+                    results[file_hash] = result
         except Exception as e:
-            logger.error(f"Polygon verification failed: {str(e)}")
-            raise BlockchainError(f"Polygon verification failed: {str(e)}")
+            # Multicall3 is not deployed on every chain (e.g. local dev nodes)
+            logger.warning(f"Multicall3 batch verification unavailable: {str(e)}. Verifying individually.")
+            remaining = [file_hash for file_hash in misses if file_hash not in results]
+            verified = await asyncio.gather(*(
+                self._verify_document_cached(ctx, file_hash) for file_hash in remaining
+            ))
+            results.update(zip(remaining, verified))
+        
+        return [results[file_hash] for file_hash in file_hashes]
     
     async def _verify_document_mock(self, file_hash: str) -> Dict[str, Any]:
         """Verify document on mock blockchain"""
         try:
-            if file_hash not in self._mock_documents:
-                return {
-                    "verified": False,
-                    "error": "Document not found on blockchain"
-                }
-            
-            doc_data = self._mock_documents[file_hash]
-            
-            return {
-                "verified": True,
-                "user_did": doc_data['user_did'],
-                "timestamp": doc_data['timestamp'],
-                "metadata": doc_data['metadata'],
-                "revoked": doc_data['revoked'],
-                "network": "mock"
-            }
+            await self._mock_chain.ensure_loaded()
+            # Single lookup: misses return without a second dict probe
+            return self._format_mock_verification(self._mock_chain.documents.get(file_hash))
             
         except Exception as e:
             logger.error(f"Mock verification failed: {str(e)}")
             raise BlockchainError(f"Mock verification failed: {str(e)}")
     
+    def _verify_documents_mock(self, file_hashes: List[str]) -> List[Dict[str, Any]]:
+        """Verify many documents on the mock blockchain in a single pass"""
+        get_document = self._mock_chain.documents.get
+        return [self._format_mock_verification(get_document(file_hash)) for file_hash in file_hashes]
+    
+    def _format_mock_verification(self, doc_data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the verification response for a mock document record"""
+        if doc_data is None:
+            return dict(_NOT_FOUND)
+        
+        return {
+            "verified": True,
+            "user_did": doc_data['user_did'],
+            "timestamp": doc_data['timestamp'],
+            "metadata": doc_data['metadata'],
+            "revoked": doc_data['revoked'],
+            "network": "mock"
+        }
+    
     async def get_network_status(self) -> Dict[str, Any]:
         """Get blockchain network status"""
         try:
-            if self.blockchain_type == BlockchainType.ETHEREUM:
-                return await self._get_ethereum_status()
-            elif self.blockchain_type == BlockchainType.POLYGON:
-                return await self._get_polygon_status()
-            else:
+            await self._ensure_http_session()
+            
+            if self.blockchain_type == BlockchainType.MOCK:
                 return await self._get_mock_status()
+            return await self._get_evm_status(self.chains[self.blockchain_type])
                 
         except Exception as e:
             logger.error(f"Error getting network status: {str(e)}")
             raise BlockchainError(f"Network status check failed: {str(e)}")
     
-    async def _get_ethereum_status(self) -> Dict[str, Any]:
-        """Get Ethereum network status"""
-        try:
-            latest_block = self.ethereum_w3.eth.block_number
-            gas_price = self.ethereum_w3.eth.gas_price
-            chain_id = self.ethereum_w3.eth.chain_id
-            
-            return {
-                "status": "connected",
-                "network": "ethereum",
-                "chain_id": chain_id,
-                "latest_block": latest_block,
-                "gas_price_gwei": self.ethereum_w3.from_wei(gas_price, 'gwei'),
-                "account_address": self.account.address,
-                "account_balance": self.ethereum_w3.from_wei(
-                    self.ethereum_w3.eth.get_balance(self.account.address), 'ether'
-                )
-            }
-        except Exception as e:
-            return {
-                "status": "error",
-                "network": "ethereum",
-                "error": str(e)
-            }
-    
-    async def _get_polygon_status(self) -> Dict[str, Any]:
-        """Get Polygon network status"""
+    async def _get_evm_status(self, ctx: ChainContext) -> Dict[str, Any]:
+        """Get Ethereum or Polygon network status"""
+        cache_key = (ctx.network, ctx.chain_id, ctx.account.address)
+        cached = _NETWORK_STATUS_CACHE.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+        
         try:
-            latest_block = self.polygon_w3.eth.block_number
-            gas_price = self.polygon_w3.eth.gas_price
-            chain_id = self.polygon_w3.eth.chain_id
+            # chain_id is pinned at init; the remaining reads are independent
+            latest_block, gas_price, balance = await asyncio.gather(
+                ctx.w3.eth.block_number,
+                ctx.w3.eth.gas_price,
+                ctx.w3.eth.get_balance(ctx.account.address)
+            )
             
-            return {
+            status = {
                 "status": "connected",
-                "network": "polygon",
-                "chain_id": chain_id,
+                "network": ctx.network,
+                "chain_id": ctx.chain_id,
                 "latest_block": latest_block,
-                "gas_price_gwei": self.polygon_w3.from_wei(gas_price, 'gwei'),
-                "account_address": self.account.address,
-                "account_balance": self.polygon_w3.from_wei(
-                    self.polygon_w3.eth.get_balance(self.account.address), 'ether'
-                )
+                "gas_price_gwei": ctx.w3.from_wei(gas_price, 'gwei'),
+                "account_address": ctx.account.address,
+                "account_balance": ctx.w3.from_wei(balance, 'ether')
             }
+            _NETWORK_STATUS_CACHE[cache_key] = status
+            return dict(status)
         except Exception as e:
             return {
                 "status": "error",
-                "network": "polygon",
+                "network": ctx.network,
                 "error": str(e)
             }
     
     async def _get_mock_status(self) -> Dict[str, Any]:
         """Get mock blockchain status"""
+        chain = self._mock_chain
+        await chain.ensure_loaded()
         return {
             "status": "connected",
             "network": "mock",
-            "latest_block": self._block_counter,
-            "total_documents": len(self._mock_documents),
-            "total_transactions": len(self._mock_transactions)
+            "latest_block": chain.block_counter,
+            "total_documents": len(chain.documents),
+            "total_transactions": len(chain.transactions)
         }
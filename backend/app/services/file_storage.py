@@ -1,90 +1,254 @@
+import asyncio
+import base64
 import boto3
+from boto3.s3.transfer import TransferConfig
+import functools
 import hashlib
 import logging
-from typing import Optional
+import uuid
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import unquote, urlsplit
 from fastapi import UploadFile
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Read size for streaming hashes; keeps memory flat regardless of file size
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Multipart settings for upload_fileobj: split anything over 5 MiB into 8 MiB
+# parts and send up to 16 parts in parallel
+UPLOAD_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=5 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=16,
+    use_threads=True
+)
+
+@functools.lru_cache(maxsize=1)
+def _get_s3_client():
+    """Process-wide S3 client; boto3 clients are thread-safe and slow to build"""
+    return boto3.client(
+        's3',
+        endpoint_url=settings.S3_ENDPOINT_URL,
+        aws_access_key_id=settings.S3_ACCESS_KEY_ID,
+        aws_secret_access_key=settings.S3_SECRET_ACCESS_KEY,
+        region_name=settings.S3_REGION
+    )
+
+class HashingReader:
+    """
+    Read-only file wrapper that feeds every byte read into a SHA-256 digest.
+    It deliberately has no seek(), so boto3 reads it strictly front to back
+    """
+    def __init__(self, fileobj):
+        self.fileobj = fileobj
+        self.sha256 = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.fileobj.read(size)
+        self.sha256.update(data)
+        return data
+
+    def hexdigest(self) -> str:
+        return self.sha256.hexdigest()
+
 class FileStorageService:
     def __init__(self):
-        self.s3_client = boto3.client(
-            's3',
-            endpoint_url=settings.S3_ENDPOINT_URL,
-            aws_access_key_id=settings.S3_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.S3_SECRET_ACCESS_KEY,
-            region_name=settings.S3_REGION
-        )
+        self.s3_client = _get_s3_client()
         self.bucket_name = settings.S3_BUCKET_NAME
 
     async def upload_file(self, file: UploadFile) -> str:
         """
         Upload a file to S3/MinIO storage
         """
+        file_url, _ = await self.upload_file_with_hash(file)
+        return file_url
+
+    async def upload_file_with_hash(self, file: UploadFile) -> Tuple[str, str]:
+        """
+        Upload a file to S3/MinIO storage, returning (file URL, SHA256 hash)
+        """
         try:
-            # Generate unique filename
-            file_hash = self.calculate_hash(file)
+            # Hash while uploading in a single pass over the body; the upload
+            # runs in a worker thread so a large file doesn't block the event loop
             file_extension = self._get_file_extension(file.filename)
+            temp_key, file_hash = await asyncio.to_thread(self._upload_hashed, file)
             filename = f"{file_hash}{file_extension}"
             
-            # Upload file
-            self.s3_client.upload_fileobj(
-                file.file,
-                self.bucket_name,
-                filename,
-                ExtraArgs={
-                    'ContentType': file.content_type,
-                    'ACL': 'private'
-                }
-            )
+            # Move the object to its content-addressed key
+            await asyncio.to_thread(self._promote_upload, temp_key, filename)
             
             # Generate URL
             file_url = f"{settings.S3_ENDPOINT_URL}/{self.bucket_name}/{filename}"
             
             logger.info(f"File uploaded successfully: {filename}")
-            return file_url
+            return file_url, file_hash
             
         except Exception as e:
             logger.error(f"Error uploading file: {str(e)}")
             raise Exception(f"File upload failed: {str(e)}")
 
+    def _upload_hashed(self, file: UploadFile) -> Tuple[str, str]:
+        """
+        Upload the file under a temporary key, returning (temporary key, SHA256 hash)
+        """
+        file.file.seek(0)
+        reader = HashingReader(file.file)
+        temp_key = f"tmp/{uuid.uuid4().hex}"
+        self.s3_client.upload_fileobj(
+            reader,
+            self.bucket_name,
+            temp_key,
+            ExtraArgs={
+                'ContentType': file.content_type,
+                'ACL': 'private'
+            },
+            Config=UPLOAD_TRANSFER_CONFIG
+        )
+        file.file.seek(0)  # Reset file pointer
+        return temp_key, reader.hexdigest()
+
+    def _promote_upload(self, temp_key: str, filename: str):
+        """
+        Copy the temporary upload to its final key and remove the temporary object
+        """
+        self.s3_client.copy_object(
+            Bucket=self.bucket_name,
+            Key=filename,
+            CopySource={'Bucket': self.bucket_name, 'Key': temp_key},
+            ACL='private'
+        )
+        self.s3_client.delete_object(Bucket=self.bucket_name, Key=temp_key)
+
     def calculate_hash(self, file: UploadFile) -> str:
         """
         Calculate SHA256 hash of file content
         """
         try:
-            # Read file content
-            content = file.file.read()
+            # Hash from the start in fixed-size chunks instead of reading the whole file
+            file.file.seek(0)
+            sha256 = hashlib.sha256()
+            while chunk := file.file.read(HASH_CHUNK_SIZE):
+                sha256.update(chunk)
             file.file.seek(0)  # Reset file pointer
             
-            # Calculate hash
-            return hashlib.sha256(content).hexdigest()
+            return sha256.hexdigest()
         except Exception as e:
             logger.error(f"Error calculating file hash: {str(e)}")
             raise Exception(f"Hash calculation failed: {str(e)}")
 
-    def delete_file(self, file_url: str) -> bool:
+    def generate_upload_url(self, filename: str, content_type: str, file_hash: str, expires_in: int = 3600) -> Dict[str, Any]:
         """
-        Delete a file from storage
+        Generate a presigned PUT URL so the client uploads straight to S3/MinIO.
+        The object key is the content hash, and the signed SHA-256 checksum makes
+        the storage server reject any body that doesn't match it
         """
         try:
-            # Extract filename from URL
-            filename = file_url.split('/')[-1]
+            key = f"{file_hash}{self._get_file_extension(filename)}"
+            checksum = base64.b64encode(bytes.fromhex(file_hash)).decode()
+            
+            url = self.s3_client.generate_presigned_url(
+                'put_object',
+                Params={
+                    'Bucket': self.bucket_name,
+                    'Key': key,
+                    'ContentType': content_type,
+                    'ChecksumSHA256': checksum
+                },
+                ExpiresIn=expires_in
+            )
             
+            return {
+                "upload_url": url,
+                "key": key,
+                "headers": {
+                    "Content-Type": content_type,
+                    "x-amz-checksum-sha256": checksum
+                },
+                "expires_in": expires_in
+            }
+        except Exception as e:
+            logger.error(f"Error generating upload URL: {str(e)}")
+            raise Exception(f"Upload URL generation failed: {str(e)}")
+
+    def get_uploaded_file(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Return size, content type and SHA-256 of an uploaded object, or None if it doesn't exist
+        """
+        try:
+            head = self.s3_client.head_object(Bucket=self.bucket_name, Key=key, ChecksumMode='ENABLED')
+        except self.s3_client.exceptions.ClientError as e:
+            if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+                return None
+            logger.error(f"Error reading uploaded file: {str(e)}")
+            raise Exception(f"Upload lookup failed: {str(e)}")
+        
+        # Storage only reports a whole-object SHA-256 when a single-part upload
+        # carried one (multipart checksums end in "-<parts>"); otherwise stream
+        # the object and hash it here rather than trust the client
+        checksum = head.get('ChecksumSHA256')
+        if checksum and '-' not in checksum:
+            file_hash = base64.b64decode(checksum).hex()
+        else:
+            file_hash = self._hash_object(key)
+        
+        return {
+            "key": key,
+            "file_size": head['ContentLength'],
+            "content_type": head.get('ContentType'),
+            "file_hash": file_hash,
+            "file_url": f"{settings.S3_ENDPOINT_URL}/{self.bucket_name}/{key}"
+        }
+
+    def _hash_object(self, key: str) -> str:
+        """
+        SHA-256 of a stored object, read in chunks
+        """
+        body = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)['Body']
+        sha256 = hashlib.sha256()
+        try:
+            for chunk in body.iter_chunks(HASH_CHUNK_SIZE):
+                sha256.update(chunk)
+        finally:
+            body.close()
+        return sha256.hexdigest()
+
+    def delete_file(self, file_url: str) -> bool:
+        """
+        Delete a file from storage given its URL
+        """
+        return self.delete_file_by_key(self._key_from_url(file_url))
+
+    def delete_file_by_key(self, key: str) -> bool:
+        """
+        Delete a file from storage given its object key
+        """
+        try:
             # Delete from S3/MinIO
             self.s3_client.delete_object(
                 Bucket=self.bucket_name,
-                Key=filename
+                Key=key
             )
             
-            logger.info(f"File deleted successfully: {filename}")
+            logger.info(f"File deleted successfully: {key}")
             return True
             
         except Exception as e:
             logger.error(f"Error deleting file: {str(e)}")
             return False
 
+    def _key_from_url(self, file_url: str) -> str:
+        """
+        Extract the object key from a storage URL, ignoring any query string
+        (presigned URLs) and the bucket prefix of path-style URLs
+        """
+        path = unquote(urlsplit(file_url).path).lstrip('/')
+        bucket_prefix = f"{self.bucket_name}/"
+        if path.startswith(bucket_prefix):
+            path = path[len(bucket_prefix):]
+        return path
+
     def get_file_url(self, filename: str, expires_in: int = 3600) -> str:
         """
         Generate presigned URL for file access
@@ -1,43 +1,64 @@
-import qrcode
-import base64
-import json
+import functools
+import orjson
+import pybase64
+import segno
 from io import BytesIO
 from typing import Dict, Any
 
-class QRCodeService:
-    def __init__(self):
-        self.qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_L,
-            box_size=10,
-            border=4,
-        )
+def _make_qr(data: str) -> segno.QRCode:
+    """Build the QR symbol for data"""
+    # Encode at level L without segno's automatic error boost so the
+    # symbol matches what qrcode produced; micro QR codes are not
+    # widely supported by phone scanners. Payloads are JSON, which always
+    # ends up in byte mode, so skip segno's mode detection
+    return segno.make(data, error='l', mode='byte', boost_error=False, micro=False)
+
+@functools.lru_cache(maxsize=1024)
+def _qr_png_b64(data: str) -> str:
+    """Render a QR PNG for data as base64; repeated payloads come from the cache"""
+    # Render PNG and convert to base64. A two-colour QR image gains little
+    # from heavy deflate, so favour encode speed over the last few hundred bytes
+    buffer = BytesIO()
+    _make_qr(data).save(buffer, kind='png', scale=10, border=4, dark='black', light='white', compresslevel=1)
+    return pybase64.b64encode(buffer.getvalue()).decode('ascii')
 
+@functools.lru_cache(maxsize=1024)
+def _qr_svg(data: str) -> str:
+    """Render a QR code for data as an inline SVG document"""
+    buffer = BytesIO()
+    _make_qr(data).save(buffer, kind='svg', scale=10, border=4, dark='black', light='white', xmldecl=False)
+    return buffer.getvalue().decode('utf-8')
+
+class QRCodeService:
     def generate_qr_code(self, data: str) -> str:
         """
         Generate QR code from data and return as base64 string
         """
         try:
-            # Add data to QR code
-            self.qr.add_data(data)
-            self.qr.make(fit=True)
-            
-            # Create QR code image
-            img = self.qr.make_image(fill_color="black", back_color="white")
-            
-            # Convert to base64
-            buffer = BytesIO()
-            img.save(buffer, format='PNG')
-            img_str = base64.b64encode(buffer.getvalue()).decode()
-            
-            # Clear QR code for next use
-            self.qr.clear()
-            
-            return img_str
-            
+            return _qr_png_b64(data)
         except Exception as e:
             raise Exception(f"QR code generation failed: {str(e)}")
 
+    def generate_qr_svg(self, data: str) -> str:
+        """
+        Generate QR code from data and return as an SVG string; browsers can render
+        it inline without a PNG decode or base64 step
+        """
+        try:
+            return _qr_svg(data)
+        except Exception as e:
+            raise Exception(f"QR code generation failed: {str(e)}")
+
+    def generate_data_qr(self, qr_data: Dict[str, Any], image_format: str = "png") -> str:
+        """
+        Generate QR code for a JSON payload as base64 PNG or SVG; keys are sorted so
+        equal payloads share a cache entry
+        """
+        data = orjson.dumps(qr_data, option=orjson.OPT_SORT_KEYS).decode()
+        if image_format == "svg":
+            return self.generate_qr_svg(data)
+        return self.generate_qr_code(data)
+
     def generate_credential_qr(self, credential_data: Dict[str, Any]) -> str:
         """
         Generate QR code for credential verification
@@ -50,7 +71,7 @@ class QRCodeService:
             "timestamp": credential_data.get("timestamp")
         }
         
-        return self.generate_qr_code(json.dumps(qr_data))
+        return self.generate_data_qr(qr_data)
 
     def generate_document_qr(self, document_data: Dict[str, Any]) -> str:
         """
@@ -64,7 +85,7 @@ class QRCodeService:
             "timestamp": document_data.get("timestamp")
         }
         
-        return self.generate_qr_code(json.dumps(qr_data))
+        return self.generate_data_qr(qr_data)
 
     def decode_qr_code(self, qr_image_base64: str) -> Dict[str, Any]:
         """
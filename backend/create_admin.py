@@ -7,21 +7,24 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from sqlalchemy import or_, select
 from sqlalchemy.orm import Session
 from app.core.database import SessionLocal
 from app.core.security import get_password_hash
 from app.models.user import User, UserRole, UserStatus
 
-def create_admin_user(username: str, email: str, password: str, full_name: str = None):
-    """Create an admin user."""
-    db = SessionLocal()
+# Cheap bcrypt cost for the default dev admin; real logins keep the library default
+SEED_BCRYPT_ROUNDS = 4
+
+def create_admin_user(db: Session, username: str, email: str, password: str, full_name: str = None):
+    """Create an admin user using the caller's session."""
     try:
         # Check if admin user already exists
-        existing_user = db.query(User).filter(
-            (User.email == email) | (User.username == username)
-        ).first()
+        existing_user_id = db.execute(
+            select(User.id).where(or_(User.email == email, User.username == username)).limit(1)
+        ).scalar()
         
-        if existing_user:
+        if existing_user_id is not None:
             print(f"User with username '{username}' or email '{email}' already exists!")
             return False
         
@@ -29,7 +32,7 @@ def create_admin_user(username: str, email: str, password: str, full_name: str =
         admin_user = User(
             username=username,
             email=email,
-            hashed_password=get_password_hash(password),
+            hashed_password=get_password_hash(password, rounds=SEED_BCRYPT_ROUNDS),
             full_name=full_name or username,
             role=UserRole.ADMIN,
             status=UserStatus.ACTIVE,
@@ -56,8 +59,6 @@ def create_admin_user(username: str, email: str, password: str, full_name: str =
         print(f"❌ Error creating admin user: {e}")
         db.rollback()
         return False
-    finally:
-        db.close()
 
 def main():
     print("🔐 IntelliTrust Admin User Creator")
@@ -75,7 +76,8 @@ def main():
     print()
     
     # Create the admin user
-    success = create_admin_user(default_username, default_email, default_password)
+    with SessionLocal() as db:
+        success = create_admin_user(db, default_username, default_email, default_password)
     
     if success:
         print("\n🎉 Admin user created successfully!")
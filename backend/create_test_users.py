@@ -7,58 +7,76 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import insert, or_
 from sqlalchemy.orm import Session
 from app.core.database import SessionLocal
 from app.core.security import get_password_hash
 from app.models.user import User, UserRole, UserStatus
 
-def create_test_user(username: str, email: str, password: str, full_name: str, role: UserRole):
-    """Create a test user with specified role."""
-    db = SessionLocal()
+# Cheap bcrypt cost for dev seed accounts; real logins keep the library default
+SEED_BCRYPT_ROUNDS = 4
+
+def create_test_users(db: Session, test_users: list) -> int:
+    """Create the given test users with one INSERT on the caller's session; returns how many were created."""
     try:
-        # Check if user already exists
-        existing_user = db.query(User).filter(
-            (User.email == email) | (User.username == username)
-        ).first()
+        # Check which users already exist in a single query
+        usernames = [u["username"] for u in test_users]
+        emails = [u["email"] for u in test_users]
+        existing = db.query(User.username, User.email).filter(
+            or_(User.username.in_(usernames), User.email.in_(emails))
+        ).all()
+        taken = {value for row in existing for value in row}
+        
+        new_users = []
+        for user_data in test_users:
+            if user_data["username"] in taken or user_data["email"] in taken:
+                print(f"User with username '{user_data['username']}' or email '{user_data['email']}' already exists!")
+            else:
+                new_users.append(user_data)
         
-        if existing_user:
-            print(f"User with username '{username}' or email '{email}' already exists!")
-            return False
+        if not new_users:
+            return 0
         
-        # Create user
-        test_user = User(
-            username=username,
-            email=email,
-            hashed_password=get_password_hash(password),
-            full_name=full_name,
-            role=role,
-            status=UserStatus.ACTIVE,
-            did=f"did:intellitrust:{username}"
-        )
+        # bcrypt releases the GIL, so hash the passwords in parallel
+        with ThreadPoolExecutor(max_workers=len(new_users)) as pool:
+            hashes = list(pool.map(
+                lambda password: get_password_hash(password, rounds=SEED_BCRYPT_ROUNDS),
+                [u["password"] for u in new_users]
+            ))
         
-        db.add(test_user)
+        # Create users
+        rows = [
+            {
+                "username": u["username"],
+                "email": u["email"],
+                "hashed_password": hashed,
+                "full_name": u["full_name"],
+                "role": u["role"],
+                "status": UserStatus.ACTIVE,
+                "did": f"did:intellitrust:{u['username']}"
+            }
+            for u, hashed in zip(new_users, hashes)
+        ]
+        # Bulk RETURNING rows only line up with the input when asked to
+        ids = db.scalars(insert(User).returning(User.id, sort_by_parameter_order=True), rows).all()
         db.commit()
-        db.refresh(test_user)
         
-        print(f"✅ {role.value.title()} user '{username}' created successfully!")
-        print(f"   ID: {test_user.id}")
-        print(f"   Email: {test_user.email}")
-        print(f"   Role: {test_user.role}")
-        print(f"   Status: {test_user.status}")
-        print(f"   DID: {test_user.did}")
-        print(f"\nYou can now login with:")
-        print(f"   Username: {username}")
-        print(f"   Password: {password}")
-        print()
+        for user_data, user_id in zip(new_users, ids):
+            print(f"✅ {user_data['role'].value.title()} user '{user_data['username']}' created successfully!")
+            print(f"   ID: {user_id}")
+            print(f"   Email: {user_data['email']}")
+            print(f"   Role: {user_data['role']}")
+            print(f"   Status: {UserStatus.ACTIVE}")
+            print(f"   DID: did:intellitrust:{user_data['username']}")
+            print()
         
-        return True
+        return len(new_users)
         
     except Exception as e:
-        print(f"❌ Error creating {role.value} user: {e}")
+        print(f"❌ Error creating test users: {e}")
         db.rollback()
-        return False
-    finally:
-        db.close()
+        return 0
 
 def main():
     print("🔐 IntelliTrust Test Users Creator")
@@ -96,11 +114,9 @@ def main():
         }
     ]
     
-    success_count = 0
-    for user_data in test_users:
-        print(f"Creating {user_data['role'].value} user...")
-        if create_test_user(**user_data):
-            success_count += 1
+    print(f"Creating {len(test_users)} test users...")
+    with SessionLocal() as db:
+        success_count = create_test_users(db, test_users)
     
     print(f"\n🎉 Created {success_count}/{len(test_users)} test users successfully!")
     print("\nTest Credentials:")
@@ -5,19 +5,19 @@ Alembic Migration Helper Script for IntelliTrust
 This script provides convenient commands for managing database migrations.
 """
 
-import subprocess
 import sys
 import os
 
-def run_command(command):
-    """Run a shell command and return the result."""
+from alembic import command as alembic_command
+from alembic.config import Config
+
+def run_alembic(func, *args, **kwargs):
+    """Run an Alembic command in-process and report whether it succeeded."""
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
-        print(result.stdout)
+        func(Config("alembic.ini"), *args, **kwargs)
         return True
-    except subprocess.CalledProcessError as e:
+    except Exception as e:
         print(f"Error: {e}")
-        print(f"stderr: {e.stderr}")
         return False
 
 def main():
@@ -50,36 +50,36 @@ Examples:
     
     if command == "create" and len(sys.argv) >= 3:
         message = sys.argv[2]
-        success = run_command(f"alembic revision --autogenerate -m '{message}'")
+        success = run_alembic(alembic_command.revision, message=message, autogenerate=True)
         if success:
             print(f"\nMigration created successfully!")
             print("Review the generated migration file and run 'python migrate.py upgrade' to apply it.")
     
     elif command == "upgrade":
         revision = sys.argv[2] if len(sys.argv) > 2 else "head"
-        success = run_command(f"alembic upgrade {revision}")
+        success = run_alembic(alembic_command.upgrade, revision)
         if success:
             print(f"\nMigration upgraded to {revision} successfully!")
     
     elif command == "downgrade":
         revision = sys.argv[2] if len(sys.argv) > 2 else "-1"
-        success = run_command(f"alembic downgrade {revision}")
+        success = run_alembic(alembic_command.downgrade, revision)
         if success:
             print(f"\nMigration downgraded to {revision} successfully!")
     
     elif command == "current":
-        run_command("alembic current")
+        run_alembic(alembic_command.current)
     
     elif command == "history":
-        run_command("alembic history")
+        run_alembic(alembic_command.history)
     
     elif command == "show" and len(sys.argv) >= 3:
         revision = sys.argv[2]
-        run_command(f"alembic show {revision}")
+        run_alembic(alembic_command.show, revision)
     
     elif command == "stamp" and len(sys.argv) >= 3:
         revision = sys.argv[2]
-        success = run_command(f"alembic stamp {revision}")
+        success = run_alembic(alembic_command.stamp, revision)
         if success:
             print(f"\nDatabase stamped at {revision} successfully!")
     
@@ -35,6 +35,7 @@ async def test_blockchain_service():
         print(f"   Latest Block: {network_status.get('latest_block', 'N/A')}")
     except Exception as e:
         print(f"❌ Network Status Test Failed: {e}")
+    sys.stdout.flush()
     
     # Test 2: Document Anchoring
     print("\n📄 Test 2: Document Anchoring")
@@ -110,6 +111,7 @@ async def test_blockchain_service():
         
     except Exception as e:
         print(f"❌ Document Operations Test Failed: {e}")
+    sys.stdout.flush()
     
     # Test 7: Blockchain Info
     print("\n📋 Test 7: Blockchain Information")
@@ -129,26 +131,37 @@ async def test_blockchain_service():
         
     except Exception as e:
         print(f"❌ Blockchain Info Test Failed: {e}")
+    sys.stdout.flush()
     
     # Test 8: Multiple Documents
     print("\n📚 Test 8: Multiple Documents")
     try:
-        documents = []
-        for i in range(3):
-            content = f"Test document {i+1} for blockchain verification"
-            doc_hash = hashlib.sha256(content.encode()).hexdigest()
+        # Encode all contents up front and hash the bytes directly; these are test
+        # fixtures, not credentials, so skip the FIPS security-usage check
+        contents = [f"Test document {i+1} for blockchain verification".encode() for i in range(3)]
+        prepared = []
+        for i, content in enumerate(contents):
+            doc_hash = hashlib.sha256(content, usedforsecurity=False).hexdigest()
             user_did = f"did:example:user{i+1}"
             metadata = {"title": f"Test Document {i+1}", "type": "certificate"}
-            
-            result = await blockchain_service.anchor_document(doc_hash, user_did, metadata)
-            documents.append((doc_hash, result))
-            
+            prepared.append((doc_hash, user_did, metadata))
+        
+        # The documents are independent, so anchor them concurrently; the
+        # service hands out nonces in order under its own lock
+        results = await asyncio.gather(*(
+            blockchain_service.anchor_document(doc_hash, user_did, metadata)
+            for doc_hash, user_did, metadata in prepared
+        ))
+        documents = [(doc_hash, result) for (doc_hash, _, _), result in zip(prepared, results)]
+        
+        for i, (doc_hash, result) in enumerate(documents):
             print(f"   Document {i+1}: {doc_hash[:16]}... -> {result['transaction_hash'][:16]}...")
         
         print(f"✅ Multiple Documents Anchored Successfully")
         
     except Exception as e:
         print(f"❌ Multiple Documents Test Failed: {e}")
+    sys.stdout.flush()
     
     print("\n🎉 Blockchain Service Test Completed!")
     print("=" * 50)
@@ -167,4 +180,16 @@ async def test_blockchain_service():
     print("💡 For production use, configure real blockchain networks in your .env file")
 
 if __name__ == "__main__":
+    # Use libuv's event loop when available (uvloop ships with uvicorn[standard])
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
+    # When output goes to a pipe or file (CI), keep it block-buffered and flush
+    # once per test instead of once per line; a terminal stays line-buffered
+    if not sys.stdout.isatty():
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    
     asyncio.run(test_blockchain_service())
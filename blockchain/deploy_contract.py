@@ -5,21 +5,37 @@ Deploys the DocumentVerification contract to Ethereum/Polygon networks
 """
 
 import os
-import json
+import orjson
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from web3 import Web3
 from eth_account import Account
 import solcx
 
+SOLC_VERSION = "0.8.19"
+
+# Tip offered to validators on EIP-1559 networks; the fee cap allows the base
+# fee to double before the transaction stops being includable
+MAX_PRIORITY_FEE_GWEI = 2
+
+# Receipt polling interval per network, roughly a sixth of its block time;
+# web3's default of 0.1s mostly re-asks for a block that isn't there yet
+RECEIPT_POLL_LATENCY = {'ethereum': 2.0, 'polygon': 0.5}
+RECEIPT_TIMEOUT = 300
+
+# Compiled {abi, bytecode} artifacts keyed by compiler input hash and compiler version
+COMPILE_CACHE_DIR = os.path.join('build', 'solc-cache')
+
 # Compile the smart contract
 def compile_contract():
-    """Compile the DocumentVerification smart contract"""
+    """Compile the DocumentVerification smart contract, reusing a cached build when the source is unchanged"""
     try:
         # Read the contract source
         with open('DocumentVerification.sol', 'r') as file:
             contract_source = file.read()
         
-        # Compile the contract
-        compiled_sol = solcx.compile_standard({
+        # Standard-JSON compiler input
+        compiler_input = {
             "language": "Solidity",
             "sources": {
                 "DocumentVerification.sol": {
@@ -33,33 +49,73 @@ def compile_contract():
                     }
                 }
             }
-        }, solc_version="0.8.19")
+        }
+        
+        # Reuse a previous compile of the same input (source and settings) with
+        # the same compiler
+        cache_key = hashlib.sha256(
+            orjson.dumps(compiler_input, option=orjson.OPT_SORT_KEYS) + SOLC_VERSION.encode()
+        ).hexdigest()
+        cache_path = os.path.join(COMPILE_CACHE_DIR, f"{cache_key}.json")
+        if os.path.exists(cache_path):
+            with open(cache_path, 'rb') as f:
+                return orjson.loads(f.read())
+        
+        # Compile the contract
+        compiled_sol = solcx.compile_standard(compiler_input, solc_version=SOLC_VERSION)
         
         # Extract the contract
         contract = compiled_sol['contracts']['DocumentVerification.sol']['DocumentVerification']
-        
-        return {
+        contract_data = {
             'abi': contract['abi'],
             'bytecode': contract['evm']['bytecode']['object']
         }
         
+        os.makedirs(COMPILE_CACHE_DIR, exist_ok=True)
+        with open(cache_path, 'wb') as f:
+            f.write(orjson.dumps(contract_data))
+        
+        return contract_data
+        
     except Exception as e:
         print(f"Error compiling contract: {e}")
         return None
 
-def deploy_contract(w3, account, contract_abi, contract_bytecode):
+def deploy_contract(w3, account, contract_abi, contract_bytecode, poll_latency=0.1):
     """Deploy the contract to the blockchain"""
     try:
         # Create contract instance
         contract = w3.eth.contract(abi=contract_abi, bytecode=contract_bytecode)
         
-        # Build transaction
-        construct_txn = contract.constructor().build_transaction({
+        # Fetch fee history, nonce and chain id in parallel rather than as three
+        # back-to-back round trips
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            fee_history_future = executor.submit(w3.eth.fee_history, 5, 'latest', [50])
+            nonce_future = executor.submit(w3.eth.get_transaction_count, account.address)
+            chain_id_future = executor.submit(lambda: w3.eth.chain_id)
+        try:
+            base_fee = fee_history_future.result().get('baseFeePerGas', [0])[-1]
+        except Exception:
+            # Pre-London nodes don't implement eth_feeHistory
+            base_fee = 0
+        
+        # Price the transaction with EIP-1559 fees from the latest base fee
+        tx_params = {
             'from': account.address,
             'gas': 2000000,
-            'gasPrice': w3.eth.gas_price,
-            'nonce': w3.eth.get_transaction_count(account.address),
-        })
+            'nonce': nonce_future.result(),
+            'chainId': chain_id_future.result(),
+        }
+        if base_fee:
+            max_priority_fee = Web3.to_wei(MAX_PRIORITY_FEE_GWEI, 'gwei')
+            tx_params['maxPriorityFeePerGas'] = max_priority_fee
+            tx_params['maxFeePerGas'] = base_fee * 2 + max_priority_fee
+        else:
+            # Pre-London chains have no base fee; fall back to legacy pricing
+            tx_params['gasPrice'] = w3.eth.gas_price
+        
+        # Build transaction
+        construct_txn = contract.constructor().build_transaction(tx_params)
         
         # Sign transaction
         signed_txn = w3.eth.account.sign_transaction(construct_txn, account.key)
@@ -68,7 +124,9 @@ def deploy_contract(w3, account, contract_abi, contract_bytecode):
         tx_hash = w3.eth.send_raw_transaction(signed_txn.rawTransaction)
         
         # Wait for transaction receipt
-        tx_receipt = w3.eth.wait_for_transaction_receipt(tx_hash)
+        tx_receipt = w3.eth.wait_for_transaction_receipt(
+            tx_hash, timeout=RECEIPT_TIMEOUT, poll_latency=poll_latency
+        )
         
         return {
             'contract_address': tx_receipt.contractAddress,
@@ -81,6 +139,60 @@ def deploy_contract(w3, account, contract_abi, contract_bytecode):
         print(f"Error deploying contract: {e}")
         return None
 
+def write_if_changed(path, data):
+    """Write data to path unless the file already holds exactly those bytes; returns whether it wrote"""
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+    
+    with open(path, 'wb') as f:
+        f.write(data)
+    return True
+
+def deploy_to_network(name, rpc_url, account, contract_data):
+    """Deploy the contract to one network and save its deployment info"""
+    # Collect output and print it in one go so concurrent deployments don't interleave
+    lines = [f"\n🔗 Deploying to {name.title()}..."]
+    try:
+        w3 = Web3(Web3.HTTPProvider(rpc_url))
+        if w3.is_connected():
+            result = deploy_contract(
+                w3, account, contract_data['abi'], contract_data['bytecode'],
+                poll_latency=RECEIPT_POLL_LATENCY.get(name, 0.1)
+            )
+            if result:
+                lines.append(f"✅ Contract deployed to {name.title()}")
+                lines.append(f"   Address: {result['contract_address']}")
+                lines.append(f"   Transaction: {result['transaction_hash']}")
+                lines.append(f"   Block: {result['block_number']}")
+                lines.append(f"   Gas Used: {result['gas_used']}")
+                
+                # Save deployment info
+                deployment_info = {
+                    'network': name,
+                    'contract_address': result['contract_address'],
+                    'transaction_hash': result['transaction_hash'],
+                    'block_number': result['block_number'],
+                    'gas_used': result['gas_used'],
+                    'abi': contract_data['abi']
+                }
+                
+                with open(f'{name}_deployment.json', 'wb') as f:
+                    f.write(orjson.dumps(deployment_info, option=orjson.OPT_INDENT_2))
+                
+                lines.append(f"💾 Deployment info saved to {name}_deployment.json")
+            else:
+                lines.append(f"❌ {name.title()} deployment failed")
+        else:
+            lines.append(f"❌ Could not connect to {name.title()} network")
+    except Exception as e:
+        lines.append(f"❌ {name.title()} deployment error: {e}")
+    
+    print("\n".join(lines))
+
 def main():
     """Main deployment function"""
     print("🚀 IntelliTrust Smart Contract Deployment")
@@ -108,79 +220,25 @@ def main():
     account = Account.from_key(private_key)
     print(f"👤 Deploying from account: {account.address}")
     
-    # Deploy to Ethereum (if configured)
-    if ethereum_rpc_url and ethereum_rpc_url != 'https://sepolia.infura.io/v3/YOUR_PROJECT_ID':
-        print("\n🔗 Deploying to Ethereum...")
-        try:
-            w3 = Web3(Web3.HTTPProvider(ethereum_rpc_url))
-            if w3.is_connected():
-                result = deploy_contract(w3, account, contract_data['abi'], contract_data['bytecode'])
-                if result:
-                    print(f"✅ Contract deployed to Ethereum")
-                    print(f"   Address: {result['contract_address']}")
-                    print(f"   Transaction: {result['transaction_hash']}")
-                    print(f"   Block: {result['block_number']}")
-                    print(f"   Gas Used: {result['gas_used']}")
-                    
-                    # Save deployment info
-                    deployment_info = {
-                        'network': 'ethereum',
-                        'contract_address': result['contract_address'],
-                        'transaction_hash': result['transaction_hash'],
-                        'block_number': result['block_number'],
-                        'gas_used': result['gas_used'],
-                        'abi': contract_data['abi']
-                    }
-                    
-                    with open('ethereum_deployment.json', 'w') as f:
-                        json.dump(deployment_info, f, indent=2)
-                    
-                    print("💾 Deployment info saved to ethereum_deployment.json")
-                else:
-                    print("❌ Ethereum deployment failed")
-            else:
-                print("❌ Could not connect to Ethereum network")
-        except Exception as e:
-            print(f"❌ Ethereum deployment error: {e}")
-    
-    # Deploy to Polygon (if configured)
-    if polygon_rpc_url and polygon_rpc_url != 'https://polygon-mumbai.infura.io/v3/YOUR_PROJECT_ID':
-        print("\n🔗 Deploying to Polygon...")
-        try:
-            w3 = Web3(Web3.HTTPProvider(polygon_rpc_url))
-            if w3.is_connected():
-                result = deploy_contract(w3, account, contract_data['abi'], contract_data['bytecode'])
-                if result:
-                    print(f"✅ Contract deployed to Polygon")
-                    print(f"   Address: {result['contract_address']}")
-                    print(f"   Transaction: {result['transaction_hash']}")
-                    print(f"   Block: {result['block_number']}")
-                    print(f"   Gas Used: {result['gas_used']}")
-                    
-                    # Save deployment info
-                    deployment_info = {
-                        'network': 'polygon',
-                        'contract_address': result['contract_address'],
-                        'transaction_hash': result['transaction_hash'],
-                        'block_number': result['block_number'],
-                        'gas_used': result['gas_used'],
-                        'abi': contract_data['abi']
-                    }
-                    
-                    with open('polygon_deployment.json', 'w') as f:
-                        json.dump(deployment_info, f, indent=2)
-                    
-                    print("💾 Deployment info saved to polygon_deployment.json")
-                else:
-                    print("❌ Polygon deployment failed")
-            else:
-                print("❌ Could not connect to Polygon network")
-        except Exception as e:
-            print(f"❌ Polygon deployment error: {e}")
+    # Deploy to every configured network; each network has its own nonce and
+    # confirmation wait, so the deployments run side by side
+    networks = [
+        (name, rpc_url) for name, rpc_url, placeholder in (
+            ('ethereum', ethereum_rpc_url, 'https://sepolia.infura.io/v3/YOUR_PROJECT_ID'),
+            ('polygon', polygon_rpc_url, 'https://polygon-mumbai.infura.io/v3/YOUR_PROJECT_ID'),
+        )
+        if rpc_url and rpc_url != placeholder
+    ]
+    if networks:
+        with ThreadPoolExecutor(max_workers=len(networks)) as executor:
+            list(executor.map(
+                lambda network: deploy_to_network(network[0], network[1], account, contract_data),
+                networks
+            ))
     
     # Save contract ABI for backend use
-    with open('contract_abi.json', 'w') as f:
-        json.dump(contract_data['abi'], f, indent=2)
+    if write_if_changed('contract_abi.json', orjson.dumps(contract_data['abi'], option=orjson.OPT_INDENT_2)):
+        print("💾 Contract ABI saved to contract_abi.json")
     
     print("\n📋 Next Steps:")
     print("1. Update your .env file with the contract addresses")
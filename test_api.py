@@ -1,22 +1,27 @@
 #!/usr/bin/env python3
-import requests
-import json
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import httpx
+import orjson
 
 # Test the API endpoints
 BASE_URL = "http://localhost:8000/api/v1"
 
-def test_health():
+async def test_health(client: httpx.AsyncClient):
     """Test health endpoint"""
     try:
-        response = requests.get(f"{BASE_URL}/health")
+        response = await client.get("/health")
         print(f"Health check: {response.status_code}")
-        print(f"Response: {response.json()}")
-        return response.status_code == 200
+        print(f"Response: {orjson.loads(response.content)}")
+        return 200 <= response.status_code < 300
     except Exception as e:
         print(f"Health check failed: {e}")
         return False
 
-def test_auth():
+async def test_auth(client: httpx.AsyncClient):
     """Test authentication"""
     try:
         # Test login
@@ -24,10 +29,14 @@ def test_auth():
             "username": "admin@intellitrust.com",
             "password": "admin123"
         }
-        response = requests.post(f"{BASE_URL}/auth/login-json", json=login_data)
+        response = await client.post(
+            "/auth/login-json",
+            content=orjson.dumps(login_data),
+            headers={"Content-Type": "application/json"}
+        )
         print(f"Login: {response.status_code}")
-        if response.status_code == 200:
-            token = response.json()["access_token"]
+        if 200 <= response.status_code < 300:
+            token = orjson.loads(response.content)["access_token"]
             print(f"Token: {token[:20]}...")
             return token
         else:
@@ -37,16 +46,14 @@ def test_auth():
         print(f"Auth test failed: {e}")
         return None
 
-def test_documents(token):
-    """Test document endpoints"""
-    headers = {"Authorization": f"Bearer {token}"}
-    
+async def test_documents(client: httpx.AsyncClient):
+    """Test document endpoints; the client must already carry a bearer token"""
     try:
         # Test get documents
-        response = requests.get(f"{BASE_URL}/documents", headers=headers)
+        response = await client.get("/documents")
         print(f"Get documents: {response.status_code}")
-        if response.status_code == 200:
-            documents = response.json()
+        if 200 <= response.status_code < 300:
+            documents = orjson.loads(response.content)
             print(f"Found {len(documents)} documents")
             for doc in documents:
                 print(f"  - {doc['title']} ({doc['document_type']})")
@@ -55,21 +62,101 @@ def test_documents(token):
     except Exception as e:
         print(f"Documents test failed: {e}")
 
-if __name__ == "__main__":
-    print("Testing IntelliTrust API...")
+async def load_test(client: httpx.AsyncClient, workers: int, duration: float, qps: float = 0):
+    """Hammer the document list endpoint and report throughput and latency percentiles"""
+    latencies = []
+    errors = 0
+    deadline = time.monotonic() + duration
+    # Each worker paces itself to its share of the target rate; 0 means as fast as possible
+    interval = workers / qps if qps else 0
     
-    # Test health
-    if not test_health():
-        print("Health check failed, API might not be running")
-        exit(1)
+    async def worker():
+        nonlocal errors
+        next_start = time.monotonic()
+        while time.monotonic() < deadline:
+            start = time.monotonic()
+            try:
+                # Hit the canonical path so each request is one round trip, not a
+                # 307 slash redirect plus the real request
+                response = await client.get("/documents/")
+                if not 200 <= response.status_code < 300:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append(time.monotonic() - start)
+            
+            if interval:
+                next_start += interval
+                await asyncio.sleep(max(0, next_start - time.monotonic()))
     
-    # Test auth
-    token = test_auth()
-    if not token:
-        print("Authentication failed")
-        exit(1)
+    print(f"Load test: {workers} workers for {duration:g}s" + (f" at {qps:g} req/s" if qps else ""))
+    await asyncio.gather(*(worker() for _ in range(workers)))
     
-    # Test documents
-    test_documents(token)
+    print(f"Requests: {len(latencies)} ({len(latencies) / duration:.1f} req/s), errors: {errors}")
+    if len(latencies) >= 2:
+        cuts = statistics.quantiles(latencies, n=100)
+        print(f"Latency p50: {cuts[49] * 1000:.1f} ms, p95: {cuts[94] * 1000:.1f} ms, p99: {cuts[98] * 1000:.1f} ms")
+    return errors == 0
+
+async def main(args):
+    print("Testing IntelliTrust API...")
+    
+    async with httpx.AsyncClient(
+        base_url=BASE_URL,
+        # Follow redirects like requests did; FastAPI answers e.g. /documents
+        # with a 307 to /documents/
+        follow_redirects=True,
+        # Retry failed connection attempts so a server that is still starting
+        # up doesn't fail the whole run
+        transport=httpx.AsyncHTTPTransport(
+            retries=3,
+            limits=httpx.Limits(max_connections=max(100, args.workers))
+        )
+    ) as client:
+        # Health and login don't depend on each other, so run them together
+        healthy, token = await asyncio.gather(test_health(client), test_auth(client))
+        sys.stdout.flush()
+        
+        if not healthy:
+            print("Health check failed, API might not be running")
+            return 1
+        
+        if not token:
+            print("Authentication failed")
+            return 1
+        
+        # Authenticate every later request on this client
+        client.headers["Authorization"] = f"Bearer {token}"
+        
+        if args.duration:
+            if not await load_test(client, args.workers, args.duration, args.qps):
+                print("Load test saw errors")
+                return 1
+        else:
+            # Test documents
+            await test_documents(client)
+        sys.stdout.flush()
     
     print("API test completed!")
+    return 0
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Smoke test, or with --duration load test, the IntelliTrust API")
+    parser.add_argument("--duration", type=float, default=0, help="Run a load test for this many seconds")
+    parser.add_argument("--workers", type=int, default=10, help="Concurrent load-test workers")
+    parser.add_argument("--qps", type=float, default=0, help="Target total request rate (default: unthrottled)")
+    args = parser.parse_args()
+    
+    # When output goes to a pipe or file (CI), keep it block-buffered and flush
+    # once per test instead of once per line; a terminal stays line-buffered
+    if not sys.stdout.isatty():
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    
+    # Use libuv's event loop when available (uvloop ships with uvicorn[standard])
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
+    exit(asyncio.run(main(args)))